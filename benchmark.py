@@ -0,0 +1,125 @@
+"""Бенчмарк массивов из zd_2: прогрев, повторы, медиана/IQR, сравнение с базовой линией
+
+Запуск:
+    python benchmark.py                              # таблица на экран
+    python benchmark.py --json result.json           # сохранить результаты
+    python benchmark.py --baseline result.json       # сравнить с сохраненными
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+
+from zd_2 import DynamicArray, StaticArray
+
+
+def fill_static(n):
+    arr = StaticArray(n)
+    for i in range(n):
+        arr.push_back(i)
+
+
+def fill_dynamic(n):
+    arr = DynamicArray(10)
+    for i in range(n):
+        arr.push_back(i)
+
+
+def fill_list(n):  # базовая линия - встроенный list
+    arr = []
+    for i in range(n):
+        arr.append(i)
+
+
+CASES = {
+    "StaticArray.push_back": fill_static,
+    "DynamicArray.push_back": fill_dynamic,
+    "list.append": fill_list,
+}
+
+
+def measure(func, n, repeats=7, warmups=2):
+    """Время одного прогона func(n) в нс: список из repeats замеров"""
+    for _ in range(warmups):
+        func(n)
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        func(n)
+        samples.append(time.perf_counter_ns() - start)
+    return samples
+
+
+def summarize(samples, n):
+    """Медиана и межквартильный размах, в том числе на один элемент"""
+    q1, median, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+    return {"median_ns": median, "iqr_ns": q3 - q1, "per_item_ns": median / n,
+            "min_ns": min(samples), "repeats": len(samples)}
+
+
+def run(sizes=(10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5), repeats=7, warmups=2, cases=CASES):
+    """Результаты в виде {случай: {n: сводка}}"""
+    results = {}
+    for name, func in cases.items():
+        results[name] = {}
+        for n in sizes:
+            results[name][str(n)] = summarize(measure(func, n, repeats, warmups), n)
+    return results
+
+
+def compare(results, baseline, threshold=0.10):
+    """Регрессии: медиана выросла больше чем на threshold и вышла за IQR базы"""
+    regressions = []
+    for name, by_n in results.items():
+        for n, cur in by_n.items():
+            base = baseline.get(name, {}).get(n)
+            if base is None:
+                continue
+            limit = max(base["median_ns"] * (1 + threshold), base["median_ns"] + base["iqr_ns"])
+            if cur["median_ns"] > limit:
+                regressions.append((name, n, base["median_ns"], cur["median_ns"]))
+    return regressions
+
+
+def print_table(results):
+    print(f"{'случай':24} {'n':>8} {'медиана, мс':>12} {'IQR, мс':>9} {'нс/элемент':>11}")
+    for name, by_n in results.items():
+        for n, r in by_n.items():
+            print(f"{name:24} {n:>8} {r['median_ns'] / 1e6:>12.3f} "
+                  f"{r['iqr_ns'] / 1e6:>9.3f} {r['per_item_ns']:>11.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарк StaticArray/DynamicArray/list")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5])
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--warmups", type=int, default=2)
+    parser.add_argument("--json", help="куда сохранить результаты")
+    parser.add_argument("--baseline", help="JSON с прошлым запуском для сравнения")
+    parser.add_argument("--threshold", type=float, default=0.10, help="допустимый рост медианы")
+    args = parser.parse_args(argv)
+    if args.repeats < 2:
+        parser.error("--repeats: нужно хотя бы 2 замера, чтобы посчитать квартили")
+
+    results = run(args.sizes, args.repeats, args.warmups)
+    print_table(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version, "results": results}, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for name, n, old, new in regressions:
+            print(f"РЕГРЕССИЯ {name} n={n}: {old / 1e6:.3f} мс -> {new / 1e6:.3f} мс ({new / old:.2f}x)")
+        if regressions:
+            return 1
+        print("Регрессий нет")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
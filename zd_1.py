@@ -1,7 +1,20 @@
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+def make_storage(cap, typecode=None):
+    """Буфер на cap элементов: список или компактный array.array"""
+    if typecode is None:
+        return [None] * cap  # 8 байт на ссылку + сам объект
+    return array(typecode, [0]) * cap  # itemsize байт на элемент
+
+
 class StaticArray:
-    def __init__(self, cap=100):
-        # O(n) - создаем массив размером cap, инициализируя все элементы None
-        self.cap, self.data, self.size = cap, [None] * cap, 0
+    def __init__(self, cap=100, typecode=None):
+        # O(n) - создаем массив размером cap, инициализируя все элементы None (или 0 для typecode)
+        self.cap, self.data, self.size = cap, make_storage(cap, typecode), 0
+        self.typecode, self.blank = typecode, None if typecode is None else 0
 
     def push_back(self, v):  # O(1) - константная сложность
         if self.size >= self.cap: raise IndexError("Full")  # O(1)
@@ -28,7 +41,7 @@ class StaticArray:
         # O(n) - цикл выполняется (size - i - 1) раз
         for j in range(i, self.size - 1):
             self.data[j] = self.data[j + 1]  # O(1) внутри цикла
-        self.data[self.size - 1], self.size = None, self.size - 1  # O(1)
+        self.data[self.size - 1], self.size = self.blank, self.size - 1  # O(1)
 
     def find(self, v):  # O(n) - линейная сложность
         # O(n) - в худшем случае проходим все size элементов
@@ -36,6 +49,40 @@ class StaticArray:
             if self.data[i] == v: return i  # O(1) сравнение
         return -1  # O(1)
 
+    def _pack(self, items):  # O(k) - элементы в формате буфера
+        return items if self.typecode is None else array(self.typecode, items)
+
+    def extend(self, items):  # O(k) - одна запись срезом
+        items = list(items)
+        k = len(items)
+        if self.size + k > self.cap: raise IndexError("Full")
+        self.data[self.size:self.size + k], self.size = self._pack(items), self.size + k
+
+    def insert_many(self, i, items):  # O(n + k) - хвост сдвигается один раз
+        if i < 0 or i > self.size: raise IndexError("Bad index")
+        items = list(items)
+        k = len(items)
+        if self.size + k > self.cap: raise IndexError("Full")
+        self.data[i + k:self.size + k] = self.data[i:self.size]  # сдвиг хвоста на k
+        self.data[i:i + k], self.size = self._pack(items), self.size + k
+
+    def remove_range(self, i, j):  # O(n) - удаляем [i, j) одним сдвигом
+        if i < 0 or j > self.size or i > j: raise IndexError("Bad index")
+        k = j - i
+        self.data[i:self.size - k] = self.data[j:self.size]  # сдвиг хвоста на k влево
+        self.data[self.size - k:self.size] = make_storage(k, self.typecode)
+        self.size -= k
+
+    def find_all(self, v):  # O(n) - поиск идет внутри list.index/array.index
+        res, i = [], 0
+        try:
+            while True:
+                i = self.data.index(v, i, self.size)
+                res.append(i)
+                i += 1
+        except ValueError:
+            return res
+
     def __str__(self):  # O(n) - линейная сложность
         # O(n) - генератор проходит все size элементов
         return f"[{', '.join(str(self.data[i]) for i in range(self.size))}]"
@@ -43,17 +90,254 @@ class StaticArray:
     def __len__(self):  # O(1) - константная сложность
         return self.size  # O(1) - просто возврат значения
 
-# Демо
-arr = StaticArray(8)
-arr.push_back(10);
-arr.push_back(20);
-arr.push_back(30)
-print(f"После push_back: {arr}")
-arr.push_front(99)
-print(f"После push_front(99): {arr}")
-arr.insert(2, 777)
-print(f"После insert(2, 777): {arr}")
-print(f"Найти 777: {arr.find(777)}")
-arr.remove(1)
-print(f"После remove(1): {arr}")
-print(f"Размер: {len(arr)}")
\ No newline at end of file
+    def view(self, i=0, j=None):  # O(1) - срез без копирования
+        if self.typecode is None: raise TypeError("memoryview требует typecode")
+        j = self.size if j is None else min(j, self.size)
+        return memoryview(self.data)[i:j]
+
+# Кольцевой буфер: head - смещение первого элемента в data
+class RingStaticArray(StaticArray):
+    def __init__(self, cap=100, typecode=None):
+        super().__init__(cap, typecode)
+        self.head = 0
+
+    def _pos(self, i):  # O(1) - логический индекс -> индекс в data
+        return (self.head + i) % self.cap
+
+    def push_back(self, v):  # O(1)
+        if self.size >= self.cap: raise IndexError("Full")
+        self.data[self._pos(self.size)], self.size = v, self.size + 1
+
+    def push_front(self, v):  # O(1) - просто сдвигаем head назад
+        if self.size >= self.cap: raise IndexError("Full")
+        self.head = (self.head - 1) % self.cap
+        self.data[self.head], self.size = v, self.size + 1
+
+    def pop_front(self):  # O(1)
+        if self.size == 0: raise IndexError("Empty")
+        v, self.data[self.head] = self.data[self.head], self.blank
+        self.head, self.size = (self.head + 1) % self.cap, self.size - 1
+        return v
+
+    def pop_back(self):  # O(1)
+        if self.size == 0: raise IndexError("Empty")
+        p = self._pos(self.size - 1)
+        v, self.data[p], self.size = self.data[p], self.blank, self.size - 1
+        return v
+
+    def insert(self, i, v):  # O(min(i, n - i)) - сдвигаем ближний край
+        if i < 0 or i > self.size: raise IndexError("Bad index")
+        if self.size >= self.cap: raise IndexError("Full")
+        d, c = self.data, self.cap
+        if i < self.size - i:
+            # Левая часть сдвигается на одну позицию влево
+            self.head = h = (self.head - 1) % c
+            for k in range(h, h + i):
+                d[k % c] = d[(k + 1) % c]
+        else:
+            # Правая часть сдвигается на одну позицию вправо
+            h = self.head
+            for k in range(h + self.size, h + i, -1):
+                d[k % c] = d[(k - 1) % c]
+        d[(self.head + i) % c], self.size = v, self.size + 1
+
+    def remove(self, i):  # O(min(i, n - i)) - сдвигаем ближний край
+        if i < 0 or i >= self.size: raise IndexError("Bad index")
+        d, c, h = self.data, self.cap, self.head
+        if i < self.size - 1 - i:
+            for k in range(h + i, h, -1):
+                d[k % c] = d[(k - 1) % c]
+            d[h], self.head = self.blank, (h + 1) % c
+        else:
+            for k in range(h + i, h + self.size - 1):
+                d[k % c] = d[(k + 1) % c]
+            d[(h + self.size - 1) % c] = self.blank
+        self.size -= 1
+
+    def _normalize(self):  # O(n) - разворачиваем кольцо так, чтобы head == 0
+        if self.head:
+            self.data = self.data[self.head:] + self.data[:self.head]
+            self.head = 0
+
+    # Массовые операции: разворачиваем кольцо (O(n)) и работаем срезами
+    def extend(self, items):
+        self._normalize()
+        super().extend(items)
+
+    def insert_many(self, i, items):
+        self._normalize()
+        super().insert_many(i, items)
+
+    def remove_range(self, i, j):
+        self._normalize()
+        super().remove_range(i, j)
+
+    def find_all(self, v):
+        self._normalize()
+        return super().find_all(v)
+
+    def view(self, i=0, j=None):  # O(1), если кольцо не переходит через край
+        if self.typecode is None: raise TypeError("memoryview требует typecode")
+        if self.head + self.size > self.cap: self._normalize()
+        j = self.size if j is None else min(j, self.size)
+        return memoryview(self.data)[self.head + i:self.head + j]
+
+    def find(self, v):  # O(n)
+        for i in range(self.size):
+            if self.data[self._pos(i)] == v: return i
+        return -1
+
+    def __str__(self):  # O(n)
+        return f"[{', '.join(str(self.data[self._pos(i)]) for i in range(self.size))}]"
+
+
+# Отсортированный массив: вставка в позицию bisect, поиск за O(log n)
+class SortedStaticArray(StaticArray):
+    def add(self, v):  # O(log n) поиск + O(n) сдвиг хвоста срезом
+        if self.size >= self.cap: raise IndexError("Full")
+        i = bisect_right(self.data, v, 0, self.size)
+        self.data[i + 1:self.size + 1] = self.data[i:self.size]
+        self.data[i], self.size = v, self.size + 1
+
+    push_back = add  # "добавить элемент" - позиция определяется порядком
+
+    def push_front(self, v):
+        raise TypeError("Вставка в начало нарушит порядок, используйте add")
+
+    def insert(self, i, v):
+        raise TypeError("Вставка по индексу нарушит порядок, используйте add")
+
+    def insert_many(self, i, items):
+        raise TypeError("Вставка по индексу нарушит порядок, используйте extend")
+
+    def extend(self, items):  # O((n + k) log(n + k)) - слияние и одна запись срезом
+        items = list(items)
+        if self.size + len(items) > self.cap: raise IndexError("Full")
+        merged = sorted(list(self.data[:self.size]) + items)
+        self.data[:len(merged)], self.size = self._pack(merged), len(merged)
+
+    def lower_bound(self, v):  # O(log n) - первый индекс с data[i] >= v
+        return bisect_left(self.data, v, 0, self.size)
+
+    def find(self, v):  # O(log n) - бинарный поиск вместо линейного
+        i = self.lower_bound(v)
+        return i if i < self.size and self.data[i] == v else -1
+
+    def __contains__(self, v):  # O(log n)
+        return self.find(v) != -1
+
+    contains = __contains__
+
+    def find_all(self, v):  # O(log n) - равные элементы лежат подряд
+        return list(range(self.lower_bound(v), bisect_right(self.data, v, 0, self.size)))
+
+    def range(self, lo, hi):  # O(log n + k) - значения из [lo, hi)
+        return list(self.data[self.lower_bound(lo):self.lower_bound(hi)])
+
+
+def benchmark_ring(cap=20000, ops=1000):
+    """Сравнение push_front/insert для обычного и кольцевого массива"""
+    print(f"\n=== Бенчмарк: {ops} операций на массиве из {cap // 2} элементов ===")
+    for name, cls in (("StaticArray", StaticArray), ("RingStaticArray", RingStaticArray)):
+        for op in ("push_front", "insert(n/4)"):
+            arr = cls(cap)
+            for i in range(cap // 2):
+                arr.push_back(i)
+            start = time.perf_counter()
+            for i in range(ops):
+                if op == "push_front":
+                    arr.push_front(i)
+                else:
+                    arr.insert(len(arr) // 4, i)
+            t = time.perf_counter() - start
+            print(f"  {name:16} {op:12} {t:.4f} сек")
+
+
+def benchmark_bulk(n=5000, k=2000):
+    """Массовые операции против поэлементных циклов"""
+    print(f"\n=== Бенчмарк массовых операций: n={n}, k={k} ===")
+
+    def filled():
+        arr = StaticArray(n + k)
+        arr.extend(i % 100 for i in range(n))
+        return arr
+
+    def loop_extend(a):
+        for x in range(k): a.push_back(x)
+
+    def loop_insert(a):
+        for x in range(k): a.insert(n // 2 + x, x)
+
+    def loop_remove(a):
+        for _ in range(k): a.remove(n // 4)
+
+    def loop_find(a):
+        return [i for i in range(a.size) if a.data[i] == 7]
+
+    cases = [
+        ("extend", loop_extend, lambda a: a.extend(range(k))),
+        ("insert_many", loop_insert, lambda a: a.insert_many(n // 2, range(k))),
+        ("remove_range", loop_remove, lambda a: a.remove_range(n // 4, n // 4 + k)),
+        ("find_all", loop_find, lambda a: a.find_all(7)),
+    ]
+    for name, loop, bulk in cases:
+        a, b = filled(), filled()
+        start = time.perf_counter()
+        loop(a)
+        t_loop = time.perf_counter() - start
+        start = time.perf_counter()
+        bulk(b)
+        t_bulk = time.perf_counter() - start
+        assert str(a) == str(b)
+        print(f"  {name:13} цикл: {t_loop:.4f} сек, срезами: {t_bulk:.5f} сек, ускорение {t_loop / t_bulk:.0f}x")
+
+
+if __name__ == "__main__":
+    # Демо
+    arr = StaticArray(8)
+    arr.push_back(10);
+    arr.push_back(20);
+    arr.push_back(30)
+    print(f"После push_back: {arr}")
+    arr.push_front(99)
+    print(f"После push_front(99): {arr}")
+    arr.insert(2, 777)
+    print(f"После insert(2, 777): {arr}")
+    print(f"Найти 777: {arr.find(777)}")
+    arr.remove(1)
+    print(f"После remove(1): {arr}")
+    print(f"Размер: {len(arr)}")
+
+    ring = RingStaticArray(8)
+    for x in (10, 20, 30): ring.push_back(x)
+    ring.push_front(99)
+    ring.push_front(98)
+    print(f"\nRingStaticArray после push_front(99), push_front(98): {ring}")
+    ring.insert(3, 777)
+    print(f"После insert(3, 777): {ring}, find(777) = {ring.find(777)}")
+    print(f"pop_front: {ring.pop_front()}")
+    ring.remove(4)
+    print(f"После remove(4): {ring}, размер: {len(ring)}")
+
+    samples = StaticArray(8, typecode='d')
+    for x in (1.5, 2.5, 3.5, 4.5): samples.push_back(x)
+    mv = samples.view(1, 3)
+    print(f"\nStaticArray(typecode='d'): {samples}, view(1, 3) = {mv.tolist()}, {mv.itemsize} байт/элемент")
+
+    bulk = StaticArray(10)
+    bulk.extend([1, 2, 3, 2])
+    bulk.insert_many(1, [7, 8])
+    print(f"\nextend + insert_many(1, [7, 8]): {bulk}, find_all(2) = {bulk.find_all(2)}")
+    bulk.remove_range(1, 3)
+    print(f"remove_range(1, 3): {bulk}")
+
+    srt = SortedStaticArray(8)
+    for x in (30, 10, 20, 40, 20): srt.add(x)
+    print(f"\nSortedStaticArray после add 30,10,20,40,20: {srt}")
+    print(f"find(20) = {srt.find(20)}, 25 in srt: {25 in srt}, lower_bound(25) = {srt.lower_bound(25)}")
+    print(f"range(15, 40) = {srt.range(15, 40)}")
+    srt.remove(0)
+    print(f"После remove(0): {srt}")
+
+    benchmark_ring()
+    benchmark_bulk()
@@ -1,65 +1,321 @@
+import sys
 import time
+from array import array
+from multiprocessing import Pool, shared_memory
+
+
+def make_storage(cap, typecode=None):
+    """Буфер на cap элементов: список или компактный array.array"""
+    if typecode is None:
+        return [None] * cap  # 8 байт на ссылку + сам объект
+    return array(typecode, [0]) * cap  # itemsize байт на элемент
 
 
 class StaticArray:
-    def __init__(self, cap=100):
-        self.cap, self.data, self.size = cap, [None] * cap, 0
+    def __init__(self, cap=100, typecode=None):
+        self.cap, self.data, self.size = cap, make_storage(cap, typecode), 0
+        self.typecode = typecode
 
     def push_back(self, v):  # O(1)
         if self.size >= self.cap: raise IndexError("Full")
         self.data[self.size], self.size = v, self.size + 1
 
+    def view(self, i=0, j=None):  # O(1) - срез без копирования
+        if self.typecode is None: raise TypeError("memoryview требует typecode")
+        return memoryview(self.data)[i:self.size if j is None else min(j, self.size)]
+
     def __str__(self): return f"[{', '.join(str(self.data[i]) for i in range(self.size))}]"
 
 
 class DynamicArray:
-    def __init__(self, init_cap=10):
-        self.cap, self.data, self.size = init_cap, [None] * init_cap, 0
+    def __init__(self, init_cap=10, typecode=None, growth=2.0, shrink_at=None):
+        self.cap, self.data, self.size = init_cap, make_storage(init_cap, typecode), 0
+        self.typecode, self.init_cap = typecode, init_cap
+        # growth - множитель расширения, shrink_at - доля заполнения для сжатия вдвое
+        if growth <= 1: raise ValueError("growth должен быть больше 1")
+        if shrink_at is not None and not 0 < shrink_at < 0.5:
+            raise ValueError("shrink_at должен быть в (0, 0.5)")
+        self.growth, self.shrink_at = growth, shrink_at
+        # Счетчики для настройки стратегии
+        self.resizes = self.copied = 0
+        self.peak_cap, self.peak_size = init_cap, 0
 
     def _resize(self, new_cap):  # O(n) - копирование всех элементов
-        new_data = [None] * new_cap
+        new_data = make_storage(new_cap, self.typecode)
         for i in range(self.size):
             new_data[i] = self.data[i]
         self.data, self.cap = new_data, new_cap
+        self.resizes, self.copied = self.resizes + 1, self.copied + self.size
+        self.peak_cap = max(self.peak_cap, new_cap)
 
     def push_back(self, v):  # Амортизированная O(1)
         if self.size >= self.cap:
-            self._resize(self.cap * 2)  # Стратегия ×2
+            self._resize(max(self.cap + 1, int(self.cap * self.growth)))  # Стратегия ×growth
         self.data[self.size], self.size = v, self.size + 1
+        if self.size > self.peak_size: self.peak_size = self.size
+
+    def pop_back(self):  # Амортизированная O(1)
+        if self.size == 0: raise IndexError("Empty")
+        self.size -= 1
+        v, self.data[self.size] = self.data[self.size], None if self.typecode is None else 0
+        # Сжатие вдвое, если заполнено не больше shrink_at
+        if (self.shrink_at is not None and self.cap > self.init_cap
+                and self.size <= self.cap * self.shrink_at):
+            self._resize(max(self.init_cap, self.cap // 2))
+        return v
+
+    def stats(self):
+        """Счетчики расширений и запаса памяти"""
+        return {"resizes": self.resizes, "copied": self.copied, "cap": self.cap, "size": self.size,
+                "peak_cap": self.peak_cap, "peak_size": self.peak_size,
+                "overhead": self.peak_cap / max(self.peak_size, 1)}
+
+    def view(self, i=0, j=None):  # O(1) - срез без копирования
+        # После _resize старые view продолжают смотреть на прежний буфер
+        if self.typecode is None: raise TypeError("memoryview требует typecode")
+        return memoryview(self.data)[i:self.size if j is None else min(j, self.size)]
 
     def __str__(self):
         return f"[{', '.join(str(self.data[i]) for i in range(self.size))}]"
 
 
+# Сегментированный массив: каталог блоков фиксированного размера
+class SegmentedArray:
+    def __init__(self, block=1024, typecode=None):
+        self.shift = max(block - 1, 1).bit_length()  # размер блока - степень двойки
+        self.block, self.mask = 1 << self.shift, (1 << self.shift) - 1
+        self.blocks, self.size, self.typecode = [], 0, typecode
+
+    @property
+    def cap(self):
+        return len(self.blocks) << self.shift
+
+    def push_back(self, v):  # O(1) в худшем случае - элементы никогда не копируются
+        i, blocks = self.size, self.blocks
+        if i >> self.shift == len(blocks):
+            # Новый блок вместо копирования; каталог хранит лишь n/block ссылок
+            blocks.append(make_storage(self.block, self.typecode))
+        blocks[i >> self.shift][i & self.mask] = v
+        self.size = i + 1
+
+    def pop_back(self):  # O(1)
+        if self.size == 0: raise IndexError("Empty")
+        self.size -= 1
+        block, i = self.blocks[self.size >> self.shift], self.size & self.mask
+        v, block[i] = block[i], None if self.typecode is None else 0
+        if i == 0:
+            self.blocks.pop()  # блок опустел - отдаем память
+        return v
+
+    def _check(self, i):  # O(1) - поддержка отрицательных индексов
+        if i < 0: i += self.size
+        if not 0 <= i < self.size: raise IndexError("Bad index")
+        return i
+
+    def __getitem__(self, i):  # O(1) - сдвиг и маска вместо деления
+        i = self._check(i)
+        return self.blocks[i >> self.shift][i & self.mask]
+
+    def __setitem__(self, i, v):  # O(1)
+        i = self._check(i)
+        self.blocks[i >> self.shift][i & self.mask] = v
+
+    def __iter__(self):  # O(n) - обход блоками
+        left = self.size
+        for b in self.blocks:
+            yield from b[:min(left, self.block)]
+            left -= self.block
+
+    def __len__(self):
+        return self.size
+
+    def __str__(self):
+        return f"[{', '.join(str(x) for x in self)}]"
+
+
+def open_shared(name):
+    """Подключение к существующему сегменту (track=False есть с Python 3.13)"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+# Динамический массив в разделяемой памяти: процессы подключаются по имени
+class SharedDynamicArray:
+    # Заголовок: size, cap, gen (q) + имя сегмента данных; gen нечетный - идет расширение
+    META, NAME_LEN = 3 * 8, 64
+
+    def __init__(self, typecode='d', init_cap=1024, name=None):
+        self.typecode, self.itemsize = typecode, array(typecode).itemsize
+        self.header = shared_memory.SharedMemory(name=name, create=True, size=self.META + self.NAME_LEN)
+        self.name, self.owner = self.header.name, True
+        self.meta = self.header.buf[:self.META].cast('q')
+        self.seg = self.items = None
+        self.retired = []  # старые сегменты, на которые еще есть view
+        self._map(shared_memory.SharedMemory(create=True, size=init_cap * self.itemsize), init_cap)
+        self.gen, self.meta[0] = 0, 0  # gen, size
+        self._publish()
+
+    @classmethod
+    def attach(cls, name, typecode='d'):
+        """Читатель: подключение к массиву по имени заголовка"""
+        self = cls.__new__(cls)
+        self.typecode, self.itemsize = typecode, array(typecode).itemsize
+        self.header, self.name, self.owner = open_shared(name), name, False
+        self.meta = self.header.buf[:self.META].cast('q')
+        self.seg = self.items = None
+        self.retired, self.gen = [], -1
+        self._sync()
+        return self
+
+    def _map(self, seg, cap):  # O(1) - переключаемся на новый сегмент
+        if self.items is not None:
+            self.items.release()
+            self.retired.append(self.seg)
+        self.seg, self.cap = seg, cap
+        self.items = seg.buf[:cap * self.itemsize].cast(self.typecode)
+        self._close_retired()
+
+    def _close_retired(self):
+        alive = []
+        for seg in self.retired:
+            try:
+                seg.close()
+            except BufferError:  # пользователь еще держит memoryview
+                alive.append(seg)
+        self.retired = alive
+
+    def _publish(self):  # имя и cap пишутся между нечетным и четным gen
+        self.meta[2] = self.gen + 1
+        name = self.seg.name.encode()
+        self.header.buf[self.META:self.META + self.NAME_LEN] = name.ljust(self.NAME_LEN, b'\0')
+        self.meta[1] = self.cap
+        self.gen = self.meta[2] = self.gen + 2
+
+    def _sync(self):  # O(1), если массив не расширялся
+        while self.meta[2] != self.gen:
+            gen = self.meta[2]
+            if gen % 2:
+                continue  # писатель сейчас публикует новый сегмент
+            name = bytes(self.header.buf[self.META:self.META + self.NAME_LEN]).rstrip(b'\0').decode()
+            cap = self.meta[1]
+            if self.meta[2] != gen:
+                continue
+            try:
+                seg = open_shared(name)
+            except FileNotFoundError:
+                continue  # сегмент успели заменить - читаем заголовок заново
+            self._map(seg, cap)
+            self.gen = gen
+
+    def push_back(self, v):  # Амортизированная O(1), только для владельца
+        size = self.meta[0]
+        if size >= self.cap:
+            self._grow(self.cap * 2)
+        self.items[size] = v
+        self.meta[0] = size + 1  # размер публикуется после записи элемента
+
+    def _grow(self, new_cap):  # O(n) - одна копия байтов в новый сегмент
+        old, nbytes = self.seg, self.meta[0] * self.itemsize
+        new = shared_memory.SharedMemory(create=True, size=new_cap * self.itemsize)
+        new.buf[:nbytes] = old.buf[:nbytes]
+        self._map(new, new_cap)
+        self._publish()
+        old.unlink()  # подключенные читатели сохраняют отображение до переключения
+
+    def __len__(self):
+        return self.meta[0]
+
+    def _size(self):
+        # Размер читаем до _sync: любой сегмент, опубликованный после этого чтения,
+        # уже содержит первые size элементов (включая старый, который еще отображен)
+        size = self.meta[0]
+        self._sync()
+        return min(size, self.cap)
+
+    def __getitem__(self, i):
+        if not 0 <= i < self._size(): raise IndexError("Bad index")
+        return self.items[i]
+
+    def view(self, i=0, j=None):  # O(1) - срез без копирования
+        size = self._size()
+        return self.items[i:size if j is None else min(j, size)]
+
+    def close(self):
+        """Отключиться; все полученные view нужно освободить заранее"""
+        self.items.release()
+        self.meta.release()
+        self.retired.append(self.seg)
+        self._close_retired()
+        self.header.close()
+
+    def unlink(self):
+        """Удалить сегменты (только владелец, после close)"""
+        if self.owner:
+            self.seg.unlink()
+            self.header.unlink()
+
+
+def shared_sum(name, i, j):
+    """Задача воркера: подключиться по имени и сложить срез без копирования"""
+    arr = SharedDynamicArray.attach(name)
+    with arr.view(i, j) as mv:
+        total = sum(mv)
+    arr.close()
+    return total
+
+
+def shared_demo(n=1000000, workers=4):
+    print(f"\n=== SharedDynamicArray: {n} чисел, {workers} процесса ===")
+    arr = SharedDynamicArray('d', init_cap=1024)
+    for i in range(n):
+        arr.push_back(float(i))
+    print(f"   Размер: {len(arr)}, вместимость: {arr.cap}, поколение: {arr.gen}")
+    step = n // workers
+    tasks = [(arr.name, k * step, n if k == workers - 1 else (k + 1) * step) for k in range(workers)]
+    with Pool(workers) as pool:
+        start = time.perf_counter()
+        total = sum(pool.starmap(shared_sum, tasks))
+        t = time.perf_counter() - start
+    print(f"   Сумма из воркеров: {total:.0f} (ожидалось {sum(range(n))}), {t:.3f} сек")
+    print(f"   В задачу передается только имя: {len(arr.name)} байт вместо {n * 8} байт данных")
+    arr.close()
+    arr.unlink()
+
+
+def percentile(sorted_values, p):
+    """Перцентиль p (0..100) по отсортированному списку"""
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p / 100))]
+
+
+def latency_benchmark(n=500000):
+    print(f"\n=== Задержка одного push_back (n={n}) ===")
+    clock = time.perf_counter_ns
+    for title, arr in (("DynamicArray (×2)", DynamicArray(10)),
+                       ("SegmentedArray", SegmentedArray(1024))):
+        lat = [0] * n
+        for i in range(n):
+            start = clock()
+            arr.push_back(i)
+            lat[i] = clock() - start
+        lat.sort()
+        print(f"   {title:18} p50={percentile(lat, 50)} нс, p99={percentile(lat, 99)} нс, "
+              f"max={lat[-1] / 1e6:.2f} мс")
+
+
 def test_performance():
+    # Прогрев, повторы и медиана/IQR - см. benchmark.py (там же JSON и сравнение с базой)
+    import benchmark
+
     print("=== Сравнение производительности ===")
     n = 100000
+    print("\n1-3. push_back: StaticArray, DynamicArray и list (медиана из 7 повторов)")
+    benchmark.print_table(benchmark.run(sizes=(10 ** 3, 10 ** 4, n)))
 
-    # Тест статического массива
-    print(f"\n1. Статический массив (вместимость: {n})")
-    start = time.time()
-    static_arr = StaticArray(n)
-    for i in range(n):
-        static_arr.push_back(i)
-    static_time = time.time() - start
-    print(f"   Время: {static_time:.4f} сек")
-    print(f"   Размер: {static_arr.size}, Вместимость: {static_arr.cap}")
-
-    # Тест динамического массива
-    print(f"\n2. Динамический массив (начальная вместимость: 10)")
-    start = time.time()
     dynamic_arr = DynamicArray(10)
     for i in range(n):
         dynamic_arr.push_back(i)
-    dynamic_time = time.time() - start
-    print(f"   Время: {dynamic_time:.4f} сек")
-    print(f"   Размер: {dynamic_arr.size}, Вместимость: {dynamic_arr.cap}")
-
-    # Сравнение
-    print(f"\n3. Сравнение:")
-    print(f"   Разница во времени: {dynamic_time / static_time:.2f}x")
-    print(f"   Статический: {static_time:.4f} сек")
-    print(f"   Динамический: {dynamic_time:.4f} сек")
 
     # Анализ расширений
     print(f"\n4. Анализ расширений динамического массива:")
@@ -67,10 +323,47 @@ def test_performance():
     print(f"   Финальная вместимость: {dynamic_arr.cap}")
     print(f"   Коэффициент расширения: {dynamic_arr.cap / 10}")
 
-    # Показываем логи расширения
-    print(f"\n5. Логика расширения (стратегия ×2):")
-    print(f"   10 → 20 → 40 → 80 → 160 → 320 → ...")
-    print(f"   Последнее расширение до: {dynamic_arr.cap}")
+    # Реальные счетчики расширений
+    st = dynamic_arr.stats()
+    print(f"\n5. Счетчики расширений (стратегия ×{dynamic_arr.growth}):")
+    print(f"   Расширений: {st['resizes']}, скопировано элементов: {st['copied']}"
+          f" ({st['copied'] / n:.2f} на элемент)")
+    print(f"   Пиковая вместимость: {st['peak_cap']} при размере {st['peak_size']}"
+          f" (запас {st['overhead']:.2f}x)")
+
+
+def growth_report(n=100000):
+    """Копирование против запаса памяти для разных стратегий"""
+    print(f"\n=== Стратегии расширения и сжатия (n={n}) ===")
+    print(f"   {'growth':>6} {'resizes':>8} {'copied/n':>9} {'peak_cap/n':>11} {'после pop':>10}")
+    for growth in (1.25, 1.5, 2.0, 3.0):
+        arr = DynamicArray(10, growth=growth, shrink_at=0.25)
+        for i in range(n):
+            arr.push_back(i)
+        grow = arr.stats()
+        for _ in range(n - n // 10):
+            arr.pop_back()
+        print(f"   {growth:>6} {grow['resizes']:>8} {grow['copied'] / n:>9.2f} "
+              f"{grow['peak_cap'] / n:>11.2f} {arr.cap:>10}")
+
+def nbytes(arr):
+    """Память под данные: сам буфер + объекты элементов (для списка)"""
+    total = sys.getsizeof(arr.data)
+    if arr.typecode is None:
+        total += sum(sys.getsizeof(arr.data[i]) for i in range(arr.size))
+    return total
+
+
+def memory_report(n=100000):
+    print(f"\n=== Память на элемент (n={n}) ===")
+    for title, make in (("StaticArray", lambda tc: StaticArray(n, tc)),
+                        ("DynamicArray", lambda tc: DynamicArray(10, tc))):
+        for tc, gen in ((None, float), ('d', float), (None, int), ('i', int)):
+            arr = make(tc)
+            for i in range(n):
+                arr.push_back(gen(i * 1000))
+            backend = "list" if tc is None else f"array('{tc}')"
+            print(f"   {title:12} {backend:10} {gen.__name__:5}: {nbytes(arr) / n:.1f} байт/элемент")
 
 
 def demonstrate_dynamic():
@@ -118,9 +411,31 @@ if __name__ == "__main__":
     # Показываем объяснение
     complexity_explanation()
 
+    # Настройка стратегии по реальным счетчикам
+    growth_report()
+
+    # Сравнение памяти list и array.array
+    memory_report()
+
+    # Хвостовые задержки: удвоение против сегментов
+    latency_benchmark()
+
+    # Раздача данных воркерам через разделяемую память
+    shared_demo()
+
     # Пример использования
     print("\n=== Пример быстрого использования ===")
     dyn = DynamicArray(2)
     for i in range(5):
         dyn.push_back(i)
-        print(f"Добавил {i}: размер={dyn.size}, емкость={dyn.cap}")
\ No newline at end of file
+        print(f"Добавил {i}: размер={dyn.size}, емкость={dyn.cap}")
+
+    typed = DynamicArray(2, typecode='d')
+    for i in range(5):
+        typed.push_back(i / 2)
+    print(f"typecode='d': {typed}, view(1, 4) = {typed.view(1, 4).tolist()}")
+
+    seg = SegmentedArray(block=4)
+    for i in range(10):
+        seg.push_back(i * i)
+    print(f"SegmentedArray(block=4): {seg}, блоков={len(seg.blocks)}, seg[7]={seg[7]}, seg[-1]={seg[-1]}")
\ No newline at end of file
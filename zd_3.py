@@ -1,20 +1,52 @@
+import math
+import random
+import time
+import tracemalloc
+
+
 class Node:
+    __slots__ = ("val", "next")  # без __dict__ - узел в несколько раз меньше
+
     def __init__(self, val):
         self.val, self.next = val, None
 
 
+# Пул свободных узлов: удаленные узлы переиспользуются вместо новых аллокаций
+class NodePool:
+    def __init__(self, limit=1024):
+        self.free, self.limit = [], limit
+
+    def get(self, val):  # O(1)
+        if self.free:
+            node = self.free.pop()
+            node.val = val
+            return node
+        return Node(val)
+
+    def put(self, node):  # O(1) - храним не больше limit узлов
+        if len(self.free) < self.limit:
+            node.val = node.next = None
+            self.free.append(node)
+
+
 class SinglyLinkedList:
-    def __init__(self):
-        self.head, self.size = None, 0
+    def __init__(self, pool=None):
+        self.head, self.size, self.pool = None, 0, pool
+
+    def _new(self, val):  # O(1) - узел из пула, если он задан
+        return self.pool.get(val) if self.pool else Node(val)
+
+    def _free(self, node):  # O(1) - вернуть узел в пул
+        if self.pool: self.pool.put(node)
 
     # O(1) - всегда быстро
     def push_front(self, val):
-        new = Node(val)
+        new = self._new(val)
         new.next, self.head, self.size = self.head, new, self.size + 1
 
     # O(n) - нужно дойти до конца
     def push_back(self, val):
-        new = Node(val)
+        new = self._new(val)
         if not self.head:
             self.head = new
         else:
@@ -39,7 +71,9 @@ class SinglyLinkedList:
             return False
 
         if self.head.val == val:
-            self.head, self.size = self.head.next, self.size - 1
+            node = self.head
+            self.head, self.size = node.next, self.size - 1
+            self._free(node)
             return True
 
         cur = self.head
@@ -47,7 +81,9 @@ class SinglyLinkedList:
             cur = cur.next
 
         if cur.next:
-            cur.next, self.size = cur.next.next, self.size - 1
+            node = cur.next
+            cur.next, self.size = node.next, self.size - 1
+            self._free(node)
             return True
 
         return False
@@ -73,56 +109,484 @@ class SinglyLinkedList:
 
 # Оптимизированный список с хвостом
 class FastList(SinglyLinkedList):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, pool=None, indexed=False):
+        super().__init__(pool)
         self.tail = None
+        # Индекс: значение -> предшественники его узлов в порядке списка (None - голова)
+        self.index = {} if indexed else None
+
+    # O(1)
+    def push_front(self, val):
+        old = self.head
+        super().push_front(val)
+        if not old: self.tail = self.head
+        if self.index is not None:
+            if old: self._repoint(old.val, None, self.head)
+            self.index.setdefault(val, []).insert(0, None)
 
     # O(1)
     def push_back(self, val):
-        new = Node(val)
+        new = self._new(val)
+        pred = self.tail
         if not self.head:
             self.head = self.tail = new
         else:
             self.tail.next, self.tail = new, new
         self.size += 1
+        if self.index is not None:
+            self.index.setdefault(val, []).append(pred)
+
+    # O(1) в среднем с индексом, иначе O(n)
+    def remove(self, val):
+        if self.index is None:
+            pred, cur = None, self.head
+            while cur and cur.val != val:
+                pred, cur = cur, cur.next
+            if not cur:
+                return False
+        else:
+            preds = self.index.get(val)
+            if not preds:
+                return False
+            pred = preds.pop(0)  # первое вхождение, как в обычном remove
+            if not preds: del self.index[val]
+        self._unlink(pred)
+        return True
+
+    def _unlink(self, pred):  # O(1) - удаление узла после pred (None - голова)
+        node = pred.next if pred else self.head
+        nxt = node.next
+        if pred:
+            pred.next = nxt
+        else:
+            self.head = nxt
+        if nxt and self.index is not None: self._repoint(nxt.val, node, pred)
+        if node is self.tail: self.tail = pred
+        self.size -= 1
+        self._free(node)
+
+    # O(1) в среднем с индексом, иначе O(n)
+    def __contains__(self, val):
+        return val in self.index if self.index is not None else self.find(val) != -1
+
+    # O(n) - бывшая голова становится хвостом; индекс перестраивается целиком
+    def reverse(self):
+        self.tail = self.head
+        super().reverse()
+        if self.index is not None: self._rebuild_index()
+
+    # O(1) без индекса - узлы other подвешиваются к хвосту, other становится пустым
+    def concat(self, other):
+        if other is self or not other.head:
+            return
+        first, last, count = self._take(other)
+        if self.index is not None:  # O(len(other)) - новые вхождения идут в конец
+            pred, cur = self.tail, first
+            while cur:
+                self.index.setdefault(cur.val, []).append(pred)
+                pred, cur = cur, cur.next
+        if self.head:
+            self.tail.next = first
+        else:
+            self.head = first
+        self.tail, self.size = last, self.size + count
+
+    # O(1) без индекса - узлы other встают перед головой, other становится пустым
+    def splice_front(self, other):
+        if other is self or not other.head:
+            return
+        first, last, count = self._take(other)
+        if self.index is not None:  # O(len(other)) - новые вхождения идут в начало
+            if self.head: self._repoint(self.head.val, None, last)
+            added, pred, cur = {}, None, first
+            while cur:
+                added.setdefault(cur.val, []).append(pred)
+                pred, cur = cur, cur.next
+            for val, preds in added.items():
+                self.index[val] = preds + self.index.get(val, [])
+        last.next = self.head
+        self.head = first
+        if not self.tail: self.tail = last
+        self.size += count
+
+    @staticmethod
+    def _take(other):  # забрать цепочку узлов other: (первый, последний, количество)
+        first, last = other.head, getattr(other, "tail", None)
+        if last is None:  # обычный SinglyLinkedList - хвост ищем проходом
+            last = first
+            while last.next:
+                last = last.next
+        count = other.size
+        other.head, other.size = None, 0
+        if isinstance(other, FastList):
+            other.tail = None
+            if other.index is not None: other.index = {}
+        return first, last, count
+
+    def _repoint(self, val, old_pred, new_pred):  # O(число дубликатов val)
+        preds = self.index[val]
+        for k, p in enumerate(preds):
+            if p is old_pred:
+                preds[k] = new_pred
+                return
+
+    def _rebuild_index(self):  # O(n)
+        self.index, pred, cur = {}, None, self.head
+        while cur:
+            self.index.setdefault(cur.val, []).append(pred)
+            pred, cur = cur, cur.next
+
+
+# Развернутый список: в каждом узле - небольшой массив значений
+class UnrolledNode:
+    __slots__ = ("vals", "next")
+
+    def __init__(self, vals=None):
+        self.vals, self.next = vals if vals is not None else [], None
+
+
+class UnrolledList:
+    def __init__(self, block=64):
+        self.block, self.head, self.tail, self.size = block, None, None, 0
+
+    # O(block) - сдвиг внутри одного узла
+    def push_front(self, val):
+        if not self.head or len(self.head.vals) >= self.block:
+            node = UnrolledNode()
+            node.next, self.head = self.head, node
+            if not self.tail: self.tail = node
+        self.head.vals.insert(0, val)
+        self.size += 1
+
+    # O(1)
+    def push_back(self, val):
+        if not self.tail or len(self.tail.vals) >= self.block:
+            node = UnrolledNode()
+            if self.tail:
+                self.tail.next = node
+            else:
+                self.head = node
+            self.tail = node
+        self.tail.vals.append(val)
+        self.size += 1
+
+    # O(n / block + block) - поиск узла + вставка в его массив
+    def insert(self, i, val):
+        if i < 0 or i > self.size: raise IndexError("Bad index")
+        if i == self.size:
+            return self.push_back(val)
+        node = self.head
+        while i >= len(node.vals):
+            i, node = i - len(node.vals), node.next
+        if len(node.vals) >= self.block:  # узел полон - делим пополам
+            half = len(node.vals) // 2
+            new = UnrolledNode(node.vals[half:])
+            del node.vals[half:]
+            new.next, node.next = node.next, new
+            if node is self.tail: self.tail = new
+            if i > half: i, node = i - half, new
+        node.vals.insert(i, val)
+        self.size += 1
+
+    # O(n / block + block) - поиск внутри узла идет в list.remove
+    def remove(self, val):
+        prev, node = None, self.head
+        while node and val not in node.vals:
+            prev, node = node, node.next
+        if not node:
+            return False
+        node.vals.remove(val)
+        self.size -= 1
+        if not node.vals:  # пустой узел выкидываем
+            if prev:
+                prev.next = node.next
+            else:
+                self.head = node.next
+            if node is self.tail: self.tail = prev
+        elif node.next and len(node.vals) + len(node.next.vals) <= self.block // 2:
+            # Два полупустых узла сливаем, чтобы не было цепочки мелких узлов
+            nxt = node.next
+            node.vals.extend(nxt.vals)
+            node.next = nxt.next
+            if nxt is self.tail: self.tail = node
+        return True
+
+    # O(n / block) переходов + сравнения внутри list.index
+    def find(self, val):
+        node, base = self.head, 0
+        while node:
+            if val in node.vals:
+                return base + node.vals.index(val)
+            base, node = base + len(node.vals), node.next
+        return -1
+
+    def __iter__(self):
+        node = self.head
+        while node:
+            yield from node.vals
+            node = node.next
+
+    def __str__(self):
+        return "->".join(str(x) for x in self) if self.size else "Пусто"
+
+    def __len__(self):
+        return self.size
+
+
+# Список с пропусками: узел хранит ссылки next на нескольких уровнях
+class SkipNode:
+    __slots__ = ("val", "next")
+
+    def __init__(self, val, level):
+        self.val, self.next = val, [None] * level  # next[k] - следующий на уровне k
+
+
+class SkipList:
+    MAX_LEVEL = 32
+
+    def __init__(self, p=0.5, seed=None):
+        self.p, self.rng = p, random.Random(seed)  # seed - для воспроизводимых замеров
+        self.head = SkipNode(None, self.MAX_LEVEL)
+        self.level, self.size = 1, 0
+        self.heights = {}  # высота -> сколько узлов такой высоты
+        self.searches = self.steps = 0  # сколько поисков и переходов по ссылкам
+
+    def _random_level(self):  # P(высота >= k) = p^(k-1)
+        lvl = 1
+        while lvl < self.MAX_LEVEL and self.rng.random() < self.p:
+            lvl += 1
+        return lvl
+
+    def _path(self, val):  # O(log n) ожид. - последний узел < val на каждом уровне
+        update, node, steps = [self.head] * self.MAX_LEVEL, self.head, 0
+        for k in range(self.level - 1, -1, -1):
+            nxt = node.next[k]
+            while nxt and nxt.val < val:
+                node, nxt, steps = nxt, nxt.next[k], steps + 1
+            update[k] = node
+        self.searches, self.steps = self.searches + 1, self.steps + steps
+        return update
+
+    # O(log n) ожидаемо
+    def insert(self, val):
+        update = self._path(val)
+        lvl = self._random_level()
+        self.level = max(self.level, lvl)
+        node = SkipNode(val, lvl)
+        for k in range(lvl):
+            node.next[k], update[k].next[k] = update[k].next[k], node
+        self.heights[lvl] = self.heights.get(lvl, 0) + 1
+        self.size += 1
+
+    # O(log n) ожидаемо
+    def find(self, val):
+        node = self._path(val)[0].next[0]
+        return node is not None and node.val == val
+
+    __contains__ = find
+
+    # O(log n) ожидаемо - удаляется одно вхождение
+    def remove(self, val):
+        update = self._path(val)
+        node = update[0].next[0]
+        if node is None or node.val != val:
+            return False
+        for k in range(len(node.next)):
+            update[k].next[k] = node.next[k]
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1
+        self.heights[len(node.next)] -= 1
+        self.size -= 1
+        return True
+
+    def __iter__(self):  # O(n) - по нижнему уровню в порядке возрастания
+        node = self.head.next[0]
+        while node:
+            yield node.val
+            node = node.next[0]
+
+    def range(self, lo, hi):  # O(log n + k) - значения из [lo, hi)
+        node = self._path(lo)[0].next[0]
+        while node and node.val < hi:
+            yield node.val
+            node = node.next[0]
+
+    def level_stats(self):
+        """Распределение высот и средняя длина поиска против log_{1/p}(n)"""
+        return {"size": self.size, "level": self.level,
+                "heights": {h: c for h, c in sorted(self.heights.items()) if c},
+                "avg_steps": self.steps / max(self.searches, 1),
+                "log_n": math.log(max(self.size, 1), 1 / self.p)}
+
+    def __str__(self):
+        return "->".join(str(x) for x in self) if self.size else "Пусто"
+
+    def __len__(self):
+        return self.size
+
+
+def skiplist_benchmark(n=50000, lookups=200, seed=42):
+    """find: линейный SinglyLinkedList против SkipList"""
+    print(f"\n=== find: SinglyLinkedList против SkipList (n={n}, {lookups} поисков, seed={seed}) ===")
+    rng = random.Random(seed)
+    values = rng.sample(range(n * 10), n)
+    queries = [rng.choice(values) for _ in range(lookups)]
+    lst, sl = SinglyLinkedList(), SkipList(seed=seed)
+    for v in values:
+        lst.push_front(v)
+        sl.insert(v)
+    for title, find in (("SinglyLinkedList", lambda v: lst.find(v) != -1), ("SkipList", sl.find)):
+        start = time.perf_counter()
+        assert all(find(v) for v in queries)
+        print(f"  {title:16}: {time.perf_counter() - start:.4f} сек")
+    st = sl.level_stats()
+    print(f"  Высоты узлов: {st['heights']}")
+    print(f"  Средний поиск: {st['avg_steps']:.1f} переходов при log_{{1/p}}(n) = {st['log_n']:.1f}")
+
+
+def unrolled_benchmark(n=1000000, block=64):
+    """Построение, обход и поиск отсутствующего значения на n элементах"""
+    print(f"\n=== SinglyLinkedList / FastList / UnrolledList(block={block}), n={n} ===")
+
+    def walk(lst):  # обход по узлам для обычных списков
+        total, cur = 0, lst.head
+        while cur:
+            total, cur = total + cur.val, cur.next
+        return total
+
+    cases = (("SinglyLinkedList", SinglyLinkedList(), "push_front", walk),
+             ("FastList", FastList(), "push_back", walk),
+             ("UnrolledList", UnrolledList(block), "push_back", sum))
+    for title, lst, push, traverse in cases:
+        add = getattr(lst, push)
+        start = time.perf_counter()
+        for i in range(n):
+            add(i)
+        t_build = time.perf_counter() - start
+        start = time.perf_counter()
+        traverse(lst)
+        t_iter = time.perf_counter() - start
+        start = time.perf_counter()
+        lst.find(-1)
+        t_find = time.perf_counter() - start
+        print(f"  {title:16}: построение {t_build:.3f} сек, обход {t_iter:.3f} сек, find(нет) {t_find:.3f} сек")
+
+
+def memory_report(n=100000):
+    """Память на узел по tracemalloc: обычный класс против __slots__"""
+    class DictNode:
+        def __init__(self, val):
+            self.val, self.next = val, None
+
+    print(f"\n=== Память на узел (n={n}, tracemalloc) ===")
+    for title, cls in (("Node с __dict__", DictNode), ("Node с __slots__", Node)):
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        head = None
+        for _ in range(n):
+            node = cls(None)  # только сам узел, без объектов-значений
+            node.next, head = head, node
+        used = tracemalloc.get_traced_memory()[0] - base
+        tracemalloc.stop()
+        del head
+        print(f"  {title:17}: {used / n:.1f} байт/узел")
+
+
+def churn_benchmark(n=1000, ops=300000, limit=1024):
+    """push_front + remove на списке из n элементов: с пулом и без"""
+    print(f"\n=== Churn: {ops} пар push_front/remove на списке из {n} ===")
+    for title, pool in (("без пула", None), (f"пул на {limit}", NodePool(limit))):
+        lst = SinglyLinkedList(pool)
+        for i in range(n):
+            lst.push_front(i)
+        start = time.perf_counter()
+        for _ in range(ops):
+            lst.push_front(-1)
+            lst.remove(-1)  # удаляемый узел в голове - O(1)
+        t = time.perf_counter() - start
+        print(f"  {title:12}: {t:.3f} сек")
+
+
+if __name__ == "__main__":
+    # Сравнение операций
+    print("=== СРАВНЕНИЕ ОПЕРАЦИЙ ===")
+    print("\nВставка в начало:")
+    print("  Список: O(1) - просто создать узел")
+    print("  Массив: O(n) - сдвигать все элементы")
+
+    print("\nВставка в конец:")
+    print("  Список: O(n) - идти до конца")
+    print("  Список(с tail): O(1) - есть указатель на конец")
+    print("  Массив: O(1) - если есть место")
+
+    print("\nУдаление по значению:")
+    print("  Список: O(n) - найти + удалить")
+    print("  Массив: O(n) - найти + сдвинуть")
+
+    print("\nПоиск по значению:")
+    print("  Список: O(n) - линейный поиск")
+    print("  Массив: O(n) - линейный поиск")
 
+    # Демо
+    print("\n=== ДЕМО ===")
+    lst = SinglyLinkedList()
+    lst.push_front(3);
+    lst.push_front(2);
+    lst.push_front(1)
+    print(f"После push_front 3,2,1: {lst}")
 
-# Сравнение операций
-print("=== СРАВНЕНИЕ ОПЕРАЦИЙ ===")
-print("\nВставка в начало:")
-print("  Список: O(1) - просто создать узел")
-print("  Массив: O(n) - сдвигать все элементы")
+    lst.push_back(4);
+    lst.push_back(5)
+    print(f"После push_back 4,5: {lst}")
 
-print("\nВставка в конец:")
-print("  Список: O(n) - идти до конца")
-print("  Список(с tail): O(1) - есть указатель на конец")
-print("  Массив: O(1) - если есть место")
+    print(f"Найти 2: {lst.find(2)}")
+    print(f"Найти 99: {lst.find(99)}")
 
-print("\nУдаление по значению:")
-print("  Список: O(n) - найти + удалить")
-print("  Массив: O(n) - найти + сдвинуть")
+    lst.remove(2)
+    print(f"После удаления 2: {lst}")
 
-print("\nПоиск по значению:")
-print("  Список: O(n) - линейный поиск")
-print("  Массив: O(n) - линейный поиск")
+    lst.reverse()
+    print(f"После разворота: {lst}")
 
-# Демо
-print("\n=== ДЕМО ===")
-lst = SinglyLinkedList()
-lst.push_front(3);
-lst.push_front(2);
-lst.push_front(1)
-print(f"После push_front 3,2,1: {lst}")
+    sessions = FastList(indexed=True)
+    for sid in ("s1", "s2", "s3", "s4"):
+        sessions.push_back(sid)
+    sessions.push_front("s0")
+    sessions.remove("s2")
+    print(f"\nFastList(indexed=True): {sessions}, 's3' in: {'s3' in sessions}, 's2' in: {'s2' in sessions}")
+    sessions.reverse()
+    sessions.remove("s4")
+    print(f"После reverse и remove('s4'): {sessions}")
 
-lst.push_back(4);
-lst.push_back(5)
-print(f"После push_back 4,5: {lst}")
+    shard_a, shard_b = FastList(), FastList()
+    for x in (1, 2): shard_a.push_back(x)
+    for x in (3, 4): shard_b.push_back(x)
+    shard_a.remove(2)  # удаляем хвост - tail должен сдвинуться
+    shard_a.concat(shard_b)
+    shard_a.push_back(5)
+    head_shard = FastList()
+    head_shard.push_front(0)
+    shard_a.splice_front(head_shard)
+    print(f"concat/splice_front: {shard_a}, tail={shard_a.tail.val}, donor пуст: {len(shard_b) == 0}")
 
-print(f"Найти 2: {lst.find(2)}")
-print(f"Найти 99: {lst.find(99)}")
+    ul = UnrolledList(block=4)
+    for x in range(1, 8): ul.push_back(x)
+    ul.push_front(0)
+    ul.insert(3, 99)
+    ul.remove(5)
+    blocks, node = [], ul.head
+    while node:
+        blocks.append(node.vals)
+        node = node.next
+    print(f"\nUnrolledList(block=4): {ul}, find(99) = {ul.find(99)}, узлы: {blocks}")
 
-lst.remove(2)
-print(f"После удаления 2: {lst}")
+    sl = SkipList(seed=1)
+    for x in (30, 10, 50, 20, 40, 60):
+        sl.insert(x)
+    sl.remove(50)
+    print(f"\nSkipList: {sl}, find(40) = {sl.find(40)}, range(15, 45) = {list(sl.range(15, 45))}")
 
-lst.reverse()
-print(f"После разворота: {lst}")
\ No newline at end of file
+    memory_report()
+    churn_benchmark()
+    unrolled_benchmark()
+    skiplist_benchmark()
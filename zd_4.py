@@ -1,14 +1,43 @@
+import sys
+import tracemalloc
+from array import array
+from functools import wraps
+
+
 class Node:
+    __slots__ = ("val", "prev", "next")  # без __dict__ - узел в несколько раз меньше
+
     def __init__(self, val):
         self.val, self.prev, self.next = val, None, None
 
 
+# Пул свободных узлов: удаленные узлы переиспользуются вместо новых аллокаций
+class NodePool:
+    def __init__(self, limit=1024):
+        self.free, self.limit = [], limit
+
+    def get(self, val):  # O(1)
+        if self.free:
+            node = self.free.pop()
+            node.val = val
+            return node
+        return Node(val)
+
+    def put(self, node):  # O(1) - храним не больше limit узлов
+        if len(self.free) < self.limit:
+            node.val = node.prev = node.next = None
+            self.free.append(node)
+
+
 class DoublyLinkedList:
-    def __init__(self):
-        self.head, self.tail, self.size = None, None, 0
+    def __init__(self, pool=None):
+        self.head, self.tail, self.size, self.pool = None, None, 0, pool
+
+    def _new(self, val):  # O(1) - узел из пула, если он задан
+        return self.pool.get(val) if self.pool else Node(val)
 
     def push_back(self, val):  # O(1)
-        n = Node(val)
+        n = self._new(val)
         if not self.head:
             self.head = self.tail = n
         else:
@@ -16,7 +45,7 @@ class DoublyLinkedList:
         self.size += 1
 
     def push_front(self, val):  # O(1)
-        n = Node(val)
+        n = self._new(val)
         if not self.head:
             self.head = self.tail = n
         else:
@@ -25,7 +54,7 @@ class DoublyLinkedList:
 
     def insert_after(self, node, val):  # O(1) - узел уже есть
         if not node: return
-        n = Node(val)
+        n = self._new(val)
         n.prev, n.next = node, node.next
         if node.next: node.next.prev = n
         node.next = n
@@ -39,8 +68,54 @@ class DoublyLinkedList:
         if node == self.head: self.head = node.next
         if node == self.tail: self.tail = node.prev
         self.size -= 1
+        # С пулом удаленный узел будет переиспользован - не храните ссылки на него
+        if self.pool: self.pool.put(node)
         return True
 
+    def move_to_front(self, node):  # O(1) - перевесить узел в голову без нового узла
+        if node is self.head: return
+        node.prev.next = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.prev, node.next = None, self.head
+        self.head.prev, self.head = node, node
+
+    def splice(self, node_range, target, after=None, count=None):
+        """Перенос отрезка (first, last) в target после узла after (None - в начало)"""
+        first, last = node_range
+        if count is None:  # O(k) - только подсчет длины; с count вся операция O(1)
+            count, cur = 1, first
+            while cur is not last:
+                cur, count = cur.next, count + 1
+        # Вырезаем отрезок из self
+        p, n = first.prev, last.next
+        if p:
+            p.next = n
+        else:
+            self.head = n
+        if n:
+            n.prev = p
+        else:
+            self.tail = p
+        self.size -= count
+        # Вставляем в target (after не должен лежать внутри отрезка)
+        nxt = after.next if after else target.head
+        first.prev, last.next = after, nxt
+        if after:
+            after.next = first
+        else:
+            target.head = first
+        if nxt:
+            nxt.prev = last
+        else:
+            target.tail = last
+        target.size += count
+
+    def cursor(self, node=None):
+        return Cursor(self, node or self.head)
+
     def find(self, val):  # O(n)
         cur = self.head
         while cur:
@@ -76,23 +151,311 @@ class NodeIterator:
         return node
 
 
-# Демо
-dll = DoublyLinkedList()
-for i in range(1, 4):
-    dll.push_back(i)
-print(f"Создали: {dll}")
+# Курсор: можно удалять и вставлять во время одного прохода в обе стороны
+class Cursor:
+    def __init__(self, dll, node):
+        # node None - курсор сошел со списка: at_front - перед головой, иначе за хвостом
+        self.dll, self.node, self.at_front = dll, node, False
+
+    def __bool__(self):
+        return self.node is not None
+
+    def _current(self):
+        if self.node is None: raise IndexError("Курсор вне списка")
+        return self.node
+
+    @property
+    def value(self):
+        return self._current().val
+
+    def next(self):  # O(1); из-за головы возвращается на голову
+        if self.node is None:
+            self.node = self.dll.head if self.at_front else None
+        else:
+            self.node = self.node.next
+            self.at_front = False
+        return self.node is not None
+
+    def prev(self):  # O(1); из-за хвоста возвращается на хвост
+        if self.node is None:
+            self.node = None if self.at_front else self.dll.tail
+        else:
+            self.node = self.node.prev
+            self.at_front = self.node is None
+        return self.node is not None
+
+    def delete_current(self, forward=True):  # O(1) - курсор уходит на соседа
+        node = self._current()
+        val, self.node = node.val, node.next if forward else node.prev
+        self.at_front = not forward and self.node is None
+        self.dll.delete_node(node)
+        return val
+
+    def insert_before(self, val):  # O(1); вне списка - в тот конец, с которого сошли
+        if self.node is None:
+            self.dll.push_front(val) if self.at_front else self.dll.push_back(val)
+        elif self.node.prev is None:
+            self.dll.push_front(val)
+        else:
+            self.dll.insert_after(self.node.prev, val)
+
+    def insert_after(self, val):  # O(1); вне списка - в тот конец, с которого сошли
+        if self.node is None:
+            self.dll.push_front(val) if self.at_front else self.dll.push_back(val)
+        else:
+            self.dll.insert_after(self.node, val)
+
+
+# Двусвязный список на массивах: узел - целый индекс (handle), -1 - пустая ссылка
+class ArrayDoublyLinkedList:
+    FREE = -2  # prev свободной ячейки: такой handle уже удален
+
+    def __init__(self, cap=16):
+        cap = max(cap, 1)
+        self.vals = [None] * cap
+        self.prev = array('l', [self.FREE]) * cap
+        # Свободные ячейки связаны в цепочку через next
+        self.next = array('l', range(1, cap + 1))
+        self.next[cap - 1] = -1
+        self.free, self.head, self.tail, self.size = 0, -1, -1, 0
+
+    def _grow(self):  # O(n) - удвоение буферов, редко
+        old = len(self.vals)
+        self.vals.extend([None] * old)
+        self.prev.extend(array('l', [self.FREE]) * old)
+        self.next.extend(array('l', range(old + 1, 2 * old + 1)))
+        self.next[2 * old - 1], self.free = -1, old
+
+    def _alloc(self, val):  # O(1) амортизированно - ячейка из free-списка
+        if self.free == -1: self._grow()
+        h = self.free
+        self.free, self.vals[h] = self.next[h], val
+        return h
+
+    def push_back(self, val):  # O(1)
+        h = self._alloc(val)
+        self.prev[h], self.next[h] = self.tail, -1
+        if self.tail == -1:
+            self.head = h
+        else:
+            self.next[self.tail] = h
+        self.tail, self.size = h, self.size + 1
+        return h
+
+    def push_front(self, val):  # O(1)
+        h = self._alloc(val)
+        self.prev[h], self.next[h] = -1, self.head
+        if self.head == -1:
+            self.tail = h
+        else:
+            self.prev[self.head] = h
+        self.head, self.size = h, self.size + 1
+        return h
+
+    def insert_after(self, node, val):  # O(1) - handle уже есть
+        if node is None or node < 0 or self.prev[node] == self.FREE: return None
+        h = self._alloc(val)
+        nxt = self.next[node]
+        self.prev[h], self.next[h] = node, nxt
+        if nxt != -1: self.prev[nxt] = h
+        self.next[node] = h
+        if node == self.tail: self.tail = h
+        self.size += 1
+        return h
+
+    def delete_node(self, node):  # O(1) - ячейка уходит в free-список
+        if node is None or node < 0 or self.prev[node] == self.FREE: return False  # повторное удаление
+        p, n = self.prev[node], self.next[node]
+        if p != -1: self.next[p] = n
+        if n != -1: self.prev[n] = p
+        if node == self.head: self.head = n
+        if node == self.tail: self.tail = p
+        self.vals[node], self.prev[node] = None, self.FREE
+        self.next[node], self.free = self.free, node
+        self.size -= 1
+        return True
+
+    def get(self, node):  # O(1) - значение по handle
+        return self.vals[node]
+
+    def find(self, val):  # O(n) - handle первого вхождения или None
+        h = self.head
+        while h != -1:
+            if self.vals[h] == val:
+                return h
+            h = self.next[h]
+        return None
+
+    def __iter__(self):
+        h, vals, nxt = self.head, self.vals, self.next
+        while h != -1:
+            yield vals[h]
+            h = nxt[h]
+
+    def __len__(self):
+        return self.size
+
+    def __str__(self):
+        return "↔".join(str(x) for x in self) if self.size else "[]"
+
+
+def memory_compare(n=200000):
+    """Память на элемент по tracemalloc: узлы-объекты против массивов индексов"""
+    print(f"\n=== Память на элемент (n={n}, значения общие) ===")
+    for title, cls in (("DoublyLinkedList", DoublyLinkedList), ("ArrayDoublyLinkedList", ArrayDoublyLinkedList)):
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        lst = cls()
+        for _ in range(n):
+            lst.push_back(None)
+        used = tracemalloc.get_traced_memory()[0] - base
+        tracemalloc.stop()
+        del lst
+        print(f"  {title:22}: {used / n:.1f} байт/элемент")
+
+
+# LRU-кэш: словарь ключ -> узел + список от свежих (голова) к старым (хвост)
+class LRUCache:
+    def __init__(self, capacity, max_bytes=None, on_evict=None, sizeof=sys.getsizeof):
+        self.capacity, self.max_bytes = capacity, max_bytes
+        self.on_evict, self.sizeof = on_evict, sizeof  # on_evict(key, value)
+        self.order = DoublyLinkedList()  # node.val = (key, value, nbytes)
+        self.nodes = {}
+        self.nbytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key, default=None):  # O(1)
+        node = self.nodes.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.order.move_to_front(node)
+        return node.val[1]
+
+    def put(self, key, value):  # O(1) амортизированно (плюс вытеснения)
+        nbytes = self.sizeof(value) if self.max_bytes is not None else 0
+        node = self.nodes.get(key)
+        if node is not None:
+            self.nbytes -= node.val[2]
+            node.val = (key, value, nbytes)
+            self.order.move_to_front(node)
+        else:
+            self.order.push_front((key, value, nbytes))
+            self.nodes[key] = self.order.head
+        self.nbytes += nbytes
+        self._evict()
+
+    def _evict(self):  # выкидываем с хвоста, пока не влезем в лимиты
+        while self.order.size and (self.order.size > self.capacity or
+                                   self.max_bytes is not None and self.nbytes > self.max_bytes):
+            node = self.order.tail
+            key, value, nbytes = node.val
+            self.order.delete_node(node)
+            del self.nodes[key]
+            self.nbytes, self.evictions = self.nbytes - nbytes, self.evictions + 1
+            if self.on_evict: self.on_evict(key, value)
+
+    def __contains__(self, key):  # O(1) - не меняет порядок и счетчики
+        return key in self.nodes
+
+    def __len__(self):
+        return self.order.size
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0, "size": len(self), "bytes": self.nbytes}
+
+
+def lru_cached(capacity=128, max_bytes=None):
+    """Декоратор: мемоизация функции через LRUCache (доступен как func.cache)"""
+    def decorator(func):
+        cache, missing, kw_mark = LRUCache(capacity, max_bytes), object(), object()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args + (kw_mark,) + tuple(sorted(kwargs.items())) if kwargs else args
+            val = cache.get(key, missing)
+            if val is missing:
+                val = func(*args, **kwargs)
+                cache.put(key, val)
+            return val
+
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+
+if __name__ == "__main__":
+    # Демо
+    dll = DoublyLinkedList()
+    for i in range(1, 4):
+        dll.push_back(i)
+    print(f"Создали: {dll}")
+
+    # Вставка после найденного узла
+    node = dll.find(2)
+    if node:
+        dll.insert_after(node, 99)
+    print(f"Вставили 99 после 2: {dll}")
+
+    # Удаление узла без поиска (O(1))
+    node = dll.find(99)
+    if node:
+        dll.delete_node(node)
+    print(f"Удалили 99: {dll}")
+
+    # Итерация
+    print("Итерация:", list(dll))
+
+    # Курсор: за один проход удаляем четные и дублируем числа, кратные 3
+    dll = DoublyLinkedList()
+    for i in range(1, 10):
+        dll.push_back(i)
+    cur = dll.cursor()
+    while cur:
+        if cur.value % 2 == 0:
+            cur.delete_current()
+            continue
+        if cur.value % 3 == 0:
+            cur.insert_after(cur.value * 10)
+            cur.next()
+        cur.next()
+    print(f"Курсор (удалили четные, после кратных 3 вставили x10): {dll}")
+
+    # Перенос отрезка 30..7 в другой список за O(1) (длина известна)
+    other = DoublyLinkedList()
+    other.push_back("a")
+    other.push_back("b")
+    dll.splice((dll.find(30), dll.find(7)), other, after=other.head, count=3)
+    print(f"splice: исходный {dll} (size={dll.size}), целевой {other} (size={other.size})")
+
+    # LRU-кэш
+    evicted = []
+    cache = LRUCache(2, on_evict=lambda k, v: evicted.append(k))
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")  # "a" становится самым свежим
+    cache.put("c", 3)  # вытесняется "b"
+    print(f"LRUCache: ключи {[k for k, _, _ in cache.order]}, вытеснены {evicted}, {cache.stats()}")
+
+
+    @lru_cached(capacity=64)
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
 
-# Вставка после найденного узла
-node = dll.find(2)
-if node:
-    dll.insert_after(node, 99)
-print(f"Вставили 99 после 2: {dll}")
+    print(f"fib(60) = {fib(60)}, кэш: {fib.cache.stats()}")
 
-# Удаление узла без поиска (O(1))
-node = dll.find(99)
-if node:
-    dll.delete_node(node)
-print(f"Удалили 99: {dll}")
+    # Список на массивах: handle вместо узла
+    adll = ArrayDoublyLinkedList(2)
+    for i in range(1, 4):
+        adll.push_back(i)
+    h = adll.find(2)
+    adll.insert_after(h, 99)
+    adll.delete_node(adll.find(1))
+    adll.push_front(0)
+    print(f"ArrayDoublyLinkedList: {adll}, handle(99) = {adll.find(99)}, ячеек: {len(adll.vals)}")
 
-# Итерация
-print("Итерация:", list(dll))
\ No newline at end of file
+    memory_compare()
@@ -1,3 +1,10 @@
+import io
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
 # Стек на массиве
 class ArrayStack:
     def __init__(self):
@@ -21,23 +28,46 @@ class ArrayStack:
 
 # Стек на связном списке
 class Node:
+    __slots__ = ("val", "next")  # без __dict__ - узел в несколько раз меньше
+
     def __init__(self, val):
         self.val, self.next = val, None
 
 
+# Пул свободных узлов: снятые со стека узлы переиспользуются при push
+class NodePool:
+    def __init__(self, limit=1024):
+        self.free, self.limit = [], limit
+
+    def get(self, val):  # O(1)
+        if self.free:
+            node = self.free.pop()
+            node.val = val
+            return node
+        return Node(val)
+
+    def put(self, node):  # O(1) - храним не больше limit узлов
+        if len(self.free) < self.limit:
+            node.val = node.next = None
+            self.free.append(node)
+
+
 class ListStack:
-    def __init__(self):
+    def __init__(self, pool=None):
         self.top = None
         self.size = 0
+        self.pool = pool
 
     def push(self, x):  # O(1)
-        n = Node(x)
+        n = self.pool.get(x) if self.pool else Node(x)
         n.next, self.top, self.size = self.top, n, self.size + 1
 
     def pop(self):  # O(1)
         if not self.top: return None
-        val = self.top.val
-        self.top, self.size = self.top.next, self.size - 1
+        node = self.top
+        self.top, self.size = node.next, self.size - 1
+        val = node.val
+        if self.pool: self.pool.put(node)
         return val
 
     def peek(self):  # O(1)
@@ -66,46 +96,190 @@ def check_brackets(expr):
     return stack.is_empty()  # Все скобки должны быть закрыты
 
 
-# Демо
-print("=== ДЕМО СТЕКА ===")
+# Потоковая проверка скобок: данные подаются кусками, в памяти только стек открытых
+class BracketValidator:
+    BRACKETS = re.compile(rb'[()\[\]{}]')  # остальные символы пропускает регулярка
+    PAIRS = {ord(')'): ord('('), ord(']'): ord('['), ord('}'): ord('{')}
+    OPEN = b'([{'
 
-# Тест ArrayStack
-print("1. Стек на массиве:")
-s1 = ArrayStack()
-for i in [1, 2, 3]: s1.push(i)
-print(f"   push 1,2,3: {s1.data}")
-print(f"   pop: {s1.pop()}")
-print(f"   peek: {s1.peek()}")
-print(f"   size: {len(s1)}")
+    def __init__(self):
+        self.stack = bytearray()  # открытые скобки по одному байту
+        self.offset = 0  # сколько байт уже обработано
+        self.line, self.line_start = 1, 0  # текущая строка и смещение ее начала
+        self.error = None  # (смещение, строка, столбец, сообщение)
 
-# Тест ListStack
-print("\n2. Стек на списке:")
-s2 = ListStack()
-for i in [4, 5, 6]: s2.push(i)
-print(f"   push 4,5,6")
-print(f"   pop: {s2.pop()}")
-print(f"   peek: {s2.peek()}")
-print(f"   size: {len(s2)}")
+    def feed(self, chunk):  # O(len(chunk)) - Python-цикл только по скобкам
+        if self.error: return False
+        if isinstance(chunk, str): chunk = chunk.encode()
+        stack, pairs, opening = self.stack, self.PAIRS, self.OPEN
+        for m in self.BRACKETS.finditer(chunk):
+            ch = chunk[m.start()]
+            if ch in opening:
+                stack.append(ch)
+            elif not stack or stack.pop() != pairs[ch]:
+                self._fail(chunk, m.start(), f"неожиданная '{chr(ch)}'")
+                return False
+        newlines = chunk.count(b'\n')
+        if newlines:
+            self.line += newlines
+            self.line_start = self.offset + chunk.rfind(b'\n') + 1
+        self.offset += len(chunk)
+        return True
 
-# Проверка скобок
-print("\n3. Проверка скобок:")
-tests = [
-    ("()", True),
-    ("()[]{}", True),
-    ("(]", False),
-    ("([)]", False),
-    ("{[]}", True),
-    ("((()))", True),
-    ("((())", False)
-]
-
-for expr, expected in tests:
-    result = check_brackets(expr)
-    status = "✓" if result == expected else "✗"
-    print(f"   {status} '{expr}' -> {result} (ожидалось {expected})")
-
-# Сложность операций
-print("\n=== СЛОЖНОСТЬ ===")
-print("Массив: push O(1)*, pop O(1), peek O(1)")
-print("Список: push O(1), pop O(1), peek O(1)")
-print("* - O(1) амортизированно для массива")
\ No newline at end of file
+    def _fail(self, chunk, pos, msg):  # позиция ошибки с учетом строк внутри chunk
+        newlines = chunk.count(b'\n', 0, pos)
+        line_start = self.offset + chunk.rfind(b'\n', 0, pos) + 1 if newlines else self.line_start
+        offset = self.offset + pos
+        self.error = (offset, self.line + newlines, offset - line_start + 1, msg)
+
+    def finish(self):
+        """True, если все скобки закрыты; иначе подробности в self.error"""
+        if self.error: return False
+        if self.stack:
+            self.error = (self.offset, self.line, self.offset - self.line_start + 1,
+                          f"не закрыто скобок: {len(self.stack)}, последняя '{chr(self.stack[-1])}'")
+            return False
+        return True
+
+
+def validate_stream(f, bufsize=1 << 16):
+    """Проверка файла (открытого в 'rb') чтением по bufsize байт"""
+    v = BracketValidator()
+    while v.error is None:
+        chunk = f.read(bufsize)
+        if not chunk:
+            break
+        v.feed(chunk)
+    v.finish()
+    return v
+
+
+# Параллельная проверка: кусок сводится к (незакрытые закрывающие, незакрытые открывающие)
+TO_OPEN = bytes.maketrans(b')]}', b'([{')
+NOT_BRACKETS = bytes(c for c in range(256) if c not in b'()[]{}')
+
+
+def summarize_brackets(chunk):
+    """Сводка куска или None, если внутри куска уже есть несовпадение"""
+    closers, stack = bytearray(), bytearray()
+    pairs, opening = BracketValidator.PAIRS, BracketValidator.OPEN
+    for ch in chunk.translate(None, NOT_BRACKETS):  # позиции не нужны - просто выкидываем остальное
+        if ch in opening:
+            stack.append(ch)
+        elif not stack:
+            closers.append(ch)  # закроет что-то из предыдущих кусков
+        elif stack.pop() != pairs[ch]:
+            return None
+    return bytes(closers), bytes(stack)
+
+
+def merge_summaries(summaries):
+    """Слияние сводок слева направо - тот же результат, что у check_brackets"""
+    stack = bytearray()
+    for summary in summaries:
+        if summary is None:
+            return False
+        closers, openers = summary
+        if closers:
+            # Закрывающие должны совпасть с вершиной стека в обратном порядке
+            need = closers.translate(TO_OPEN)[::-1]
+            if len(need) > len(stack) or stack[-len(need):] != need:
+                return False
+            del stack[-len(need):]
+        stack += openers
+    return not stack
+
+
+def check_brackets_parallel(expr, workers=None, chunk_size=1 << 20):
+    """Проверка большого входа: сводки кусков считаются в пуле процессов"""
+    data = expr.encode() if isinstance(expr, str) else expr
+    chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+    if workers == 1 or len(chunks) <= 1:
+        return merge_summaries(map(summarize_brackets, chunks))
+    with ProcessPoolExecutor(workers) as pool:
+        return merge_summaries(pool.map(summarize_brackets, chunks))
+
+
+if __name__ == "__main__":
+    # Демо
+    print("=== ДЕМО СТЕКА ===")
+
+    # Тест ArrayStack
+    print("1. Стек на массиве:")
+    s1 = ArrayStack()
+    for i in [1, 2, 3]: s1.push(i)
+    print(f"   push 1,2,3: {s1.data}")
+    print(f"   pop: {s1.pop()}")
+    print(f"   peek: {s1.peek()}")
+    print(f"   size: {len(s1)}")
+
+    # Тест ListStack
+    print("\n2. Стек на списке:")
+    s2 = ListStack()
+    for i in [4, 5, 6]: s2.push(i)
+    print(f"   push 4,5,6")
+    print(f"   pop: {s2.pop()}")
+    print(f"   peek: {s2.peek()}")
+    print(f"   size: {len(s2)}")
+
+    # Проверка скобок
+    print("\n3. Проверка скобок:")
+    tests = [
+        ("()", True),
+        ("()[]{}", True),
+        ("(]", False),
+        ("([)]", False),
+        ("{[]}", True),
+        ("((()))", True),
+        ("((())", False)
+    ]
+
+    for expr, expected in tests:
+        result = check_brackets(expr)
+        status = "✓" if result == expected else "✗"
+        print(f"   {status} '{expr}' -> {result} (ожидалось {expected})")
+
+    # Потоковая проверка
+    print("\n4. Потоковая проверка (куски по 4 байта):")
+    for text in ('{"a": [1, 2],\n "b": (3)}', '{"a": [1, 2},\n "b": 3}', '{\n "a": [(1)]\n)', '[{\n}'):
+        v = validate_stream(io.BytesIO(text.encode()), bufsize=4)
+        print(f"   {text!r}: {'OK' if v.error is None else 'смещение %d, строка %d, столбец %d: %s' % v.error}")
+
+    big = ('{"key": "' + 'x' * 200 + '", "list": [1, 2, {"k": (3)}]}\n') * 20000
+    start = time.perf_counter()
+    check_brackets(big)
+    t_old = time.perf_counter() - start
+    start = time.perf_counter()
+    validate_stream(io.BytesIO(big.encode()))
+    t_new = time.perf_counter() - start
+    print(f"   {len(big) // 1024} КБ: check_brackets {t_old:.3f} сек, validate_stream {t_new:.3f} сек")
+
+    # Churn: чередование push/pop пачками
+    print("\n5. Churn ListStack (1000 циклов push x500 / pop x500):")
+    for title, pool in (("без пула", None), ("с NodePool", NodePool(1024))):
+        s3 = ListStack(pool)
+        start = time.perf_counter()
+        for _ in range(1000):
+            for i in range(500): s3.push(i)
+            for _ in range(500): s3.pop()
+        print(f"   {title}: {time.perf_counter() - start:.3f} сек")
+
+    # Параллельная проверка
+    print("\n6. Параллельная проверка сводками кусков:")
+    for expr, expected in tests:
+        assert check_brackets_parallel(expr, chunk_size=2) == expected
+    print("   Совпадает с check_brackets на тестах выше (куски по 2 символа)")
+    big = ("[" + "{()}" * 250 + "]\n") * 4000
+    start = time.perf_counter()
+    result = check_brackets(big)
+    print(f"   {len(big) // 2 ** 20} МБ, check_brackets: {result}, {time.perf_counter() - start:.3f} сек")
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        start = time.perf_counter()
+        result = check_brackets_parallel(big, workers=workers)
+        print(f"   {len(big) // 2 ** 20} МБ, процессов {workers}: {result}, {time.perf_counter() - start:.3f} сек")
+
+    # Сложность операций
+    print("\n=== СЛОЖНОСТЬ ===")
+    print("Массив: push O(1)*, pop O(1), peek O(1)")
+    print("Список: push O(1), pop O(1), peek O(1)")
+    print("* - O(1) амортизированно для массива")
@@ -1,3 +1,15 @@
+import asyncio
+import multiprocessing
+import operator
+import struct
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+from queue import Empty, Full, Queue
+
+
 # Очередь на циклическом массиве
 class CircularQueue:
     def __init__(self, capacity=10):
@@ -10,7 +22,7 @@ class CircularQueue:
     def enqueue(self, x):  # O(1)
         """Добавление в конец очереди"""
         if self.is_full():
-            raise Exception("Очередь переполнена")
+            raise Full("Очередь переполнена")
 
         self.data[self.rear] = x
         self.rear = (self.rear + 1) % self.cap  # Циклический сдвиг
@@ -19,7 +31,7 @@ class CircularQueue:
     def dequeue(self):  # O(1)
         """Удаление из начала очереди"""
         if self.is_empty():
-            raise Exception("Очередь пуста")
+            raise Empty("Очередь пуста")
 
         val = self.data[self.front]
         self.front = (self.front + 1) % self.cap  # Циклический сдвиг
@@ -50,6 +62,47 @@ class CircularQueue:
         return "->".join(result) if result else "Пусто"
 
 
+# Растущая циклическая очередь: емкость - степень двойки, индекс через & mask
+class GrowableCircularQueue(CircularQueue):
+    def __init__(self, capacity=8, shrink=False):
+        cap = 1 << max(capacity - 1, 1).bit_length()  # округляем вверх до степени двойки
+        super().__init__(cap)
+        self.mask, self.min_cap, self.shrink = cap - 1, cap, shrink
+
+    def enqueue(self, x):  # O(1) амортизированно
+        if self.size == self.cap:
+            self._resize(self.cap * 2)
+        rear = self.rear
+        self.data[rear] = x
+        self.rear = (rear + 1) & self.mask  # вместо % cap
+        self.size += 1
+
+    def dequeue(self):  # O(1) амортизированно
+        size = self.size
+        if size == 0:
+            raise Empty("Очередь пуста")
+        front, data = self.front, self.data
+        val, data[front] = data[front], None
+        self.front, self.size = (front + 1) & self.mask, size - 1
+        # Сжатие вдвое, если заполнено не больше четверти
+        if self.shrink and size <= self.cap >> 2 and self.cap > self.min_cap:
+            self._resize(self.cap >> 1)
+        return val
+
+    def _resize(self, new_cap):  # O(n) - кольцо разворачивается не более чем двумя срезами
+        end = self.front + self.size
+        if end <= self.cap:
+            items = self.data[self.front:end]
+        else:
+            items = self.data[self.front:] + self.data[:end - self.cap]
+        self.data = items + [None] * (new_cap - self.size)
+        self.cap, self.mask = new_cap, new_cap - 1
+        self.front, self.rear = 0, self.size
+
+    def is_full(self):  # O(1) - очередь растет сама
+        return False
+
+
 # Очередь на двух стеках
 class TwoStackQueue:
     def __init__(self):
@@ -65,7 +118,7 @@ class TwoStackQueue:
     def dequeue(self):  # O(n) в худшем случае, O(1) амортизированно
         """Удаление из очереди"""
         if self.is_empty():
-            raise Exception("Очередь пуста")
+            raise Empty("Очередь пуста")
 
         # Если stack_out пуст, переливаем все из stack_in
         if not self.stack_out:
@@ -104,73 +157,690 @@ class TwoStackQueue:
         return "->".join(temp) if temp else "Пусто"
 
 
-# Демонстрация
-print("=== ОЧЕРЕДЬ НА ЦИКЛИЧЕСКОМ МАССИВЕ ===")
-cq = CircularQueue(5)
-print(f"Создана очередь емкостью 5")
-
-for i in range(1, 6):
-    cq.enqueue(i * 10)
-    print(f"enqueue({i * 10}): {cq}")
-
-print(f"\npeek: {cq.peek()}")
-print(f"dequeue: {cq.dequeue()}, осталось: {cq}")
-print(f"dequeue: {cq.dequeue()}, осталось: {cq}")
-
-cq.enqueue(60)
-print(f"enqueue(60): {cq}")
-cq.enqueue(70)
-print(f"enqueue(70): {cq}")
-print(f"Размер: {len(cq)}, полная? {cq.is_full()}")
-
-print("\n=== ОЧЕРЕДЬ НА ДВУХ СТЕКАХ ===")
-tsq = TwoStackQueue()
-print("Создана очередь на двух стеках")
-
-for i in range(1, 6):
-    tsq.enqueue(i)
-    print(f"enqueue({i}): stack_in={tsq.stack_in}, stack_out={tsq.stack_out}")
-
-print(f"\npeek: {tsq.peek()}")
-print(f"dequeue: {tsq.dequeue()}")
-print(f"Состояние: stack_in={tsq.stack_in}, stack_out={tsq.stack_out}")
-print(f"dequeue: {tsq.dequeue()}")
-print(f"Очередь: {tsq}")
-
-tsq.enqueue(6)
-tsq.enqueue(7)
-print(f"\nenqueue(6), enqueue(7)")
-print(f"Очередь: {tsq}")
-print(f"Размер: {len(tsq)}")
-
-# Сравнение сложности
-print("\n=== СРАВНЕНИЕ СЛОЖНОСТИ ===")
-print("Циклический массив:")
-print("  enqueue: O(1)")
-print("  dequeue: O(1)")
-print("  peek: O(1)")
-print("\nДва стека:")
-print("  enqueue: O(1)")
-print("  dequeue: O(n) худший, O(1) амортизированно")
-print("  peek: O(n) худший, O(1) амортизированно")
-print("\nПочему два стека работают?")
-print("  В худшем случае при пустом stack_out")
-print("  переливаем все элементы из stack_in: O(n)")
-print("  Но это происходит редко, в среднем O(1)")
-
-# Пример использования
-print("\n=== ПРИМЕР ИСПОЛЬЗОВАНИЯ ===")
-# Моделирование очереди задач
-print("Очередь задач на печать:")
-queue = TwoStackQueue()  # Или CircularQueue
-
-tasks = ["doc1.pdf", "doc2.pdf", "report.docx"]
-for task in tasks:
-    queue.enqueue(task)
-    print(f"Добавлена задача: {task}")
-
-print("\nОбработка задач:")
-while not queue.is_empty():
-    task = queue.dequeue()
-    print(f"Печатается: {task}")
-    print(f"Осталось задач: {len(queue)}")
\ No newline at end of file
+# Блокирующая ограниченная очередь для потоков поверх CircularQueue
+class BlockingQueue:
+    def __init__(self, capacity=10):
+        self.q = CircularQueue(capacity)
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+    def put(self, x, timeout=None):  # O(1); ждет места, по таймауту - Full
+        with self.not_full:
+            if not self.not_full.wait_for(lambda: not self.q.is_full(), timeout):
+                raise Full("Очередь переполнена")
+            self.q.enqueue(x)
+            self.not_empty.notify()
+
+    def get(self, timeout=None):  # O(1); ждет элемент, по таймауту - Empty
+        with self.not_empty:
+            if not self.not_empty.wait_for(lambda: not self.q.is_empty(), timeout):
+                raise Empty("Очередь пуста")
+            x = self.q.dequeue()
+            self.not_full.notify()
+            return x
+
+    def put_many(self, items, timeout=None):
+        """Кладет пачку: все, что влезает, за один захват блокировки; возвращает сколько положено"""
+        items, done = list(items), 0
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.not_full:
+            while done < len(items):
+                left = None if deadline is None else deadline - time.monotonic()
+                if not self.not_full.wait_for(lambda: not self.q.is_full(), left):
+                    break  # таймаут - положили только часть
+                n = min(len(items) - done, self.q.cap - self.q.size)
+                for x in items[done:done + n]:
+                    self.q.enqueue(x)
+                done += n
+                self.not_empty.notify(n)
+        return done
+
+    def get_many(self, max_n, timeout=None):
+        """Забирает до max_n элементов за один захват; ждет хотя бы один, по таймауту - []"""
+        with self.not_empty:
+            if not self.not_empty.wait_for(lambda: not self.q.is_empty(), timeout):
+                return []
+            batch = [self.q.dequeue() for _ in range(min(max_n, self.q.size))]
+            self.not_full.notify(len(batch))
+            return batch
+
+    def __len__(self):
+        with self.lock:
+            return self.q.size
+
+
+# Очередь с агрегатом на двух стеках: элемент хранит агрегат своей части стека
+class AggQueue:
+    def __init__(self, op=min):
+        self.op = op  # ассоциативная операция двух аргументов: min, max, operator.add, math.gcd...
+        self.stack_in, self.stack_out = [], []  # пары (значение, агрегат)
+
+    def enqueue(self, x):  # O(1)
+        self.stack_in.append((x, self.op(self.stack_in[-1][1], x) if self.stack_in else x))
+
+    def dequeue(self):  # O(1) амортизированно
+        if not self.stack_out:
+            if not self.stack_in:
+                raise Empty("Очередь пуста")
+            op, out = self.op, self.stack_out
+            while self.stack_in:  # переливаем, считая агрегат от новых к старым
+                x = self.stack_in.pop()[0]
+                out.append((x, op(x, out[-1][1]) if out else x))
+        return self.stack_out.pop()[0]
+
+    def aggregate(self):  # O(1) - агрегат всей очереди от старых к новым
+        if self.stack_out and self.stack_in:
+            return self.op(self.stack_out[-1][1], self.stack_in[-1][1])
+        if self.stack_out or self.stack_in:
+            return (self.stack_out or self.stack_in)[-1][1]
+        raise Empty("Очередь пуста")
+
+    def __len__(self):
+        return len(self.stack_in) + len(self.stack_out)
+
+
+# Очередь с min/max за O(1): монотонные деки кандидатов
+class MinMaxQueue:
+    def __init__(self):
+        self.items, self.mins, self.maxs = deque(), deque(), deque()
+
+    def enqueue(self, x):  # O(1) амортизированно - выкидываем тех, кто уже не станет ответом
+        self.items.append(x)
+        while self.mins and self.mins[-1] > x:
+            self.mins.pop()
+        self.mins.append(x)
+        while self.maxs and self.maxs[-1] < x:
+            self.maxs.pop()
+        self.maxs.append(x)
+
+    def dequeue(self):  # O(1)
+        if not self.items:
+            raise Empty("Очередь пуста")
+        x = self.items.popleft()
+        if self.mins[0] == x: self.mins.popleft()
+        if self.maxs[0] == x: self.maxs.popleft()
+        return x
+
+    def min(self):  # O(1)
+        if not self.mins:
+            raise Empty("Очередь пуста")
+        return self.mins[0]
+
+    def max(self):  # O(1)
+        if not self.maxs:
+            raise Empty("Очередь пуста")
+        return self.maxs[0]
+
+    def __len__(self):
+        return len(self.items)
+
+
+def sliding_window(iterable, k, agg=min):
+    """Агрегат каждого окна из k подряд идущих значений за O(n) суммарно"""
+    if k < 1:
+        raise ValueError(f"Размер окна должен быть положительным: {k}")
+    if agg is min or agg is max:
+        q = MinMaxQueue()
+        result = q.min if agg is min else q.max
+    else:
+        q = AggQueue(agg)
+        result = q.aggregate
+    for x in iterable:
+        q.enqueue(x)
+        if len(q) > k:
+            q.dequeue()
+        if len(q) == k:
+            yield result()
+
+
+def window_benchmark(n=200000, k=100):
+    """Скользящий минимум: пересчет окна на каждом шаге против MinMaxQueue"""
+    print(f"\n=== Скользящий min: {n} точек, окно {k} ===")
+    data = [(i * 7919) % 10007 for i in range(n)]
+    start = time.perf_counter()
+    window, naive = deque(maxlen=k), []
+    for x in data:
+        window.append(x)
+        if len(window) == k:
+            naive.append(min(window))  # O(k) на каждый шаг
+    t_naive = time.perf_counter() - start
+    start = time.perf_counter()
+    fast = list(sliding_window(data, k, min))
+    t_fast = time.perf_counter() - start
+    assert fast == naive
+    print(f"   Пересчет окна: {t_naive:.3f} сек, MinMaxQueue: {t_fast:.3f} сек")
+
+
+# asyncio-очередь: maxsize > 0 - CircularQueue с ожиданием места, 0 - TwoStackQueue без предела
+class AsyncQueue:
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize
+        self.q = CircularQueue(maxsize) if maxsize > 0 else TwoStackQueue()
+        self.getters, self.putters = [], []  # ожидающие: (сколько нужно, future)
+
+    def full(self):
+        return self.maxsize > 0 and len(self.q) >= self.maxsize
+
+    def _wake(self, waiters, available):  # будим первого, кому хватает available
+        for k, (need, fut) in enumerate(waiters):
+            # Отмененных (cancel или таймаут) пропускаем - их уберет сам _sleep
+            if need <= available and not fut.done():
+                del waiters[k]
+                fut.set_result(None)
+                return
+
+    def _wake_getters(self):
+        self._wake(self.getters, len(self.q))
+
+    def _wake_putters(self):
+        self._wake(self.putters, self.maxsize - len(self.q) if self.maxsize > 0 else 1)
+
+    async def _sleep(self, waiters, need, timeout=None):
+        """Ждем пробуждения: True - разбудили, False - истек timeout"""
+        entry = (need, asyncio.get_running_loop().create_future())
+        waiters.append(entry)
+        try:
+            await (entry[1] if timeout is None else asyncio.wait_for(entry[1], timeout))
+        except asyncio.TimeoutError:
+            if entry in waiters:
+                waiters.remove(entry)
+            else:  # разбудили одновременно с таймаутом - передаем пробуждение следующему
+                self._wake_getters() if waiters is self.getters else self._wake_putters()
+            return False
+        except asyncio.CancelledError:
+            if entry in waiters:
+                waiters.remove(entry)
+            else:  # нас уже разбудили - передаем пробуждение следующему
+                self._wake_getters() if waiters is self.getters else self._wake_putters()
+            raise
+        return True
+
+    def put_nowait(self, x):  # O(1)
+        if self.full(): raise Full("Очередь переполнена")
+        self.q.enqueue(x)
+        if self.getters: self._wake_getters()
+
+    async def put(self, x):  # ждет места - обратное давление на производителя
+        while self.full():
+            await self._sleep(self.putters, 1)
+        self.put_nowait(x)
+
+    def get_nowait(self):  # O(1) амортизированно
+        x = self.q.dequeue()  # пустая очередь - Empty
+        if self.putters: self._wake_putters()
+        return x
+
+    async def get(self):
+        while self.q.is_empty():
+            await self._sleep(self.getters, 1)
+        return self.get_nowait()
+
+    async def get_batch(self, n, timeout=None):
+        """До n элементов за одно пробуждение: ждем n штук или timeout (тогда сколько есть)"""
+        need = min(n, self.maxsize) if self.maxsize > 0 else n
+        deadline = None if timeout is None else asyncio.get_running_loop().time() + timeout
+        while len(self.q) < need:
+            left = None if deadline is None else deadline - asyncio.get_running_loop().time()
+            if left is not None and left <= 0 or not await self._sleep(self.getters, need, left):
+                break
+        batch = [self.q.dequeue() for _ in range(min(n, len(self.q)))]
+        for _ in batch:
+            if not self.putters: break
+            self._wake_putters()
+        return batch
+
+    def __len__(self):
+        return len(self.q)
+
+
+async def async_benchmark(items=100000, producers=50, consumers=50, maxsize=1024, batch=64):
+    """Элементов в секунду при множестве корутин: asyncio.Queue против AsyncQueue"""
+    async def run(q, get_batch):
+        per = items // producers
+        received = [0] * consumers
+
+        async def produce():
+            for i in range(per):
+                await q.put(i)
+
+        async def consume(k):
+            while True:
+                got = await get_batch(q)
+                n = sum(1 for x in got if x is not None)
+                received[k] += n
+                if n < len(got):  # стоп-сигналы: лишние возвращаем другим
+                    for _ in range(len(got) - n - 1):
+                        await q.put(None)
+                    return
+
+        start = time.perf_counter()
+        cons = [asyncio.create_task(consume(k)) for k in range(consumers)]
+        await asyncio.gather(*(produce() for _ in range(producers)))
+        for _ in range(consumers):
+            await q.put(None)
+        await asyncio.gather(*cons)
+        assert sum(received) == per * producers
+        return per * producers / (time.perf_counter() - start)
+
+    async def one(q):
+        return [await q.get()]
+
+    print(f"\n=== asyncio: {items} элементов, {producers} произв. / {consumers} потреб. корутин ===")
+    cases = (("asyncio.Queue", asyncio.Queue(maxsize), one),
+             ("AsyncQueue get", AsyncQueue(maxsize), one),
+             (f"AsyncQueue get_batch({batch})", AsyncQueue(maxsize), lambda q: q.get_batch(batch, timeout=0.01)))
+    for title, q, get_batch in cases:
+        print(f"   {title:24}: {await run(q, get_batch):>10.0f} элем/сек")
+
+
+def open_shared(name):
+    """Подключение к существующему сегменту (track=False есть с Python 3.13)"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+# Кольцевой буфер в разделяемой памяти: один писатель, один читатель (SPSC)
+class SharedRingBuffer:
+    # Заголовок: head (байт записано) и cap - в первой кэш-линии, tail (байт прочитано) - во второй
+    HEADER, WRAP = 128, 0xFFFFFFFF
+    LEN = struct.Struct('<I')  # длина записи перед ее байтами
+
+    def __init__(self, capacity=1 << 20, name=None):
+        cap = 1 << max(capacity - 1, 1).bit_length()  # степень двойки
+        self.shm = shared_memory.SharedMemory(name=name, create=True, size=self.HEADER + cap)
+        self.owner = True
+        self._map()
+        self.ctr[0] = self.ctr[8] = 0
+        self.ctr[1] = cap
+        self.cap, self.mask = cap, cap - 1
+
+    @classmethod
+    def attach(cls, name):
+        """Вторая сторона подключается по имени сегмента"""
+        self = cls.__new__(cls)
+        self.shm, self.owner = open_shared(name), False
+        self._map()
+        self.cap = self.ctr[1]
+        self.mask = self.cap - 1
+        return self
+
+    def _map(self):
+        self.name = self.shm.name
+        self.ctr = self.shm.buf[:self.HEADER].cast('Q')  # ctr[0] head, ctr[1] cap, ctr[8] tail
+        self.data = self.shm.buf[self.HEADER:]
+        self.pending = 0  # длина последней выданной читателю записи
+
+    def try_write(self, payload):  # O(len) - False, если места нет
+        n = len(payload)
+        if n + 4 > self.cap // 2: raise ValueError("Запись больше половины буфера")
+        head = self.ctr[0]
+        pos, free = head & self.mask, self.cap - (head - self.ctr[8])
+        skip = self.cap - pos if pos + 4 + n > self.cap else 0  # хвост буфера не вмещает запись
+        if skip + 4 + n > free:
+            return False
+        if skip:
+            if skip >= 4: self.LEN.pack_into(self.data, pos, self.WRAP)
+            head, pos = head + skip, 0
+        self.LEN.pack_into(self.data, pos, n)
+        self.data[pos + 4:pos + 4 + n] = payload
+        self.ctr[0] = head + 4 + n  # публикуем после записи байтов
+        return True
+
+    def write(self, payload):  # ждет, пока читатель освободит место
+        while not self.try_write(payload):
+            time.sleep(0)
+
+    def read(self):
+        """memoryview следующей записи без копирования или None; действителен до следующего read()"""
+        tail = self.ctr[8] + self.pending
+        self.ctr[8], self.pending = tail, 0  # освобождаем прошлую запись
+        if tail == self.ctr[0]:
+            return None
+        pos = tail & self.mask
+        if self.cap - pos < 4 or self.LEN.unpack_from(self.data, pos)[0] == self.WRAP:
+            tail, pos = tail + self.cap - pos, 0
+            self.ctr[8] = tail
+        n = self.LEN.unpack_from(self.data, pos)[0]
+        self.pending = 4 + n
+        return self.data[pos + 4:pos + 4 + n]
+
+    def close(self):
+        """Все выданные read() view должны быть освобождены"""
+        self.ctr.release()
+        self.data.release()
+        self.shm.close()
+        if self.owner: self.shm.unlink()
+
+
+def ring_writer(name, n, size):
+    """Процесс-парсер: пишет n записей по size байт"""
+    ring = SharedRingBuffer.attach(name)
+    record = bytearray(size)
+    for i in range(n):
+        record[:4] = i.to_bytes(4, 'little')
+        ring.write(record)
+    ring.close()
+
+
+def queue_writer(q, n, size):
+    record = bytearray(size)
+    for i in range(n):
+        record[:4] = i.to_bytes(4, 'little')
+        q.put(bytes(record))
+
+
+def ring_benchmark(n=200000, size=32):
+    """Сообщений в секунду между двумя процессами: SharedRingBuffer против multiprocessing.Queue"""
+    print(f"\n=== Межпроцессная передача: {n} записей по {size} байт ===")
+    ring = SharedRingBuffer(1 << 20)
+    writer = multiprocessing.Process(target=ring_writer, args=(ring.name, n, size))
+    start = time.perf_counter()
+    writer.start()
+    got = 0
+    while got < n:
+        view = ring.read()
+        if view is None:
+            time.sleep(0)
+            continue
+        assert int.from_bytes(view[:4], 'little') == got
+        view.release()
+        got += 1
+    writer.join()
+    t_ring = time.perf_counter() - start
+    ring.read()  # освобождаем последнюю запись
+    ring.close()
+
+    q = multiprocessing.Queue(1024)
+    writer = multiprocessing.Process(target=queue_writer, args=(q, n, size))
+    start = time.perf_counter()
+    writer.start()
+    for i in range(n):
+        assert int.from_bytes(q.get()[:4], 'little') == i
+    writer.join()
+    t_queue = time.perf_counter() - start
+    print(f"   {'SharedRingBuffer':22}: {n / t_ring:>10.0f} сообщ/сек")
+    print(f"   {'multiprocessing.Queue':22}: {n / t_queue:>10.0f} сообщ/сек")
+
+
+def percentile(sorted_values, p):
+    """Перцентиль p (0..100) по отсортированному списку"""
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p / 100))]
+
+
+def timed_call(fn, args, enqueued, submitted):
+    """Выполняется в воркере: результат, ожидание в очереди, ожидание в пуле и время работы (нс)"""
+    start = time.monotonic_ns()  # монотонные часы общие для процессов одной машины
+    result = fn(*args)
+    return result, start - enqueued, start - submitted, time.monotonic_ns() - start
+
+
+# Исполнитель задач: пул потоков или процессов + ограничение числа задач в работе
+class JobRunner:
+    def __init__(self, workers=4, processes=False, max_pending=None):
+        pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        self.pool = pool(max_workers=workers)
+        self.slots = threading.Semaphore(max_pending or 2 * workers)  # обратное давление
+        self.queue_waits, self.pool_waits, self.runs, self.results = [], [], [], []
+        self.failed = 0
+        self.lock = threading.Lock()  # _done вызывается из потоков пула
+        self.started = time.perf_counter()
+
+    @staticmethod
+    def enqueue(queue, job):  # O(1) - задача вместе с моментом постановки в очередь
+        queue.enqueue((job, time.monotonic_ns()))
+
+    def submit(self, fn, *args, enqueued=None):  # блокируется, пока в работе max_pending задач
+        submitted = time.monotonic_ns()
+        self.slots.acquire()
+        future = self.pool.submit(timed_call, fn, args, submitted if enqueued is None else enqueued, submitted)
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future):
+        self.slots.release()
+        with self.lock:
+            if future.exception() is not None:
+                self.failed += 1
+                return
+            result, queue_wait, pool_wait, run = future.result()
+            self.results.append(result)
+            self.queue_waits.append(queue_wait)
+            self.pool_waits.append(pool_wait)
+            self.runs.append(run)
+
+    def drain(self, queue, fn):
+        """Забрать из CircularQueue/TwoStackQueue задачи, поставленные через enqueue, и отдать в пул"""
+        while not queue.is_empty():
+            job, enqueued = queue.dequeue()
+            self.submit(fn, job, enqueued=enqueued)
+
+    def shutdown(self):
+        """Дождаться всех задач и вернуть сводку по задержкам
+
+        queue_wait - от enqueue до старта в воркере (очередь задач + слот + очередь пула),
+        pool_wait - только от submit до старта.
+        """
+        self.pool.shutdown(wait=True)
+        elapsed = time.perf_counter() - self.started
+        runs = sorted(self.runs)
+        report = {"done": len(runs), "failed": self.failed, "elapsed": elapsed,
+                  "throughput": len(runs) / elapsed if elapsed else 0.0}
+        for name, values in (("queue_wait", sorted(self.queue_waits)),
+                             ("pool_wait", sorted(self.pool_waits)), ("run", runs)):
+            for p in (50, 95, 99):
+                report[f"{name}_p{p}_ms"] = percentile(values, p) / 1e6 if values else 0.0
+        return report
+
+
+def print_job(name):
+    """Задача на печать: имитация работы принтера"""
+    time.sleep(0.05)
+    return f"Напечатано: {name}"
+
+
+def cpu_job(n):
+    return sum(i * i for i in range(n))
+
+
+def print_report(title, report):
+    print(f"   {title}: {report['done']} задач ({report['failed']} с ошибкой) за {report['elapsed']:.3f} сек, "
+          f"{report['throughput']:.0f} задач/сек")
+    print(f"     ожидание в очереди p50/p95/p99: {report['queue_wait_p50_ms']:.2f}/{report['queue_wait_p95_ms']:.2f}/"
+          f"{report['queue_wait_p99_ms']:.2f} мс")
+    print(f"     ожидание в пуле    p50/p95/p99: {report['pool_wait_p50_ms']:.2f}/{report['pool_wait_p95_ms']:.2f}/"
+          f"{report['pool_wait_p99_ms']:.2f} мс")
+    print(f"     работа             p50/p95/p99: {report['run_p50_ms']:.2f}/{report['run_p95_ms']:.2f}/"
+          f"{report['run_p99_ms']:.2f} мс")
+
+
+def throughput_benchmark(items=100000, producers=2, consumers=2, capacity=1024, batch=64):
+    """Элементов в секунду: N производителей и M потребителей"""
+    print(f"\n=== Пропускная способность: {items} элементов, {producers} произв. / {consumers} потреб. ===")
+
+    def run(q, put, get_batch):
+        per = items // producers
+        received = [0] * consumers
+
+        def produce():
+            put(q, range(per))
+
+        def consume(k):
+            while True:
+                got = get_batch(q)
+                n = sum(1 for x in got if x is not None)
+                received[k] += n
+                if n < len(got):  # встретили стоп-сигналы: лишние возвращаем другим
+                    put(q, [None] * (len(got) - n - 1))
+                    return
+
+        threads = [threading.Thread(target=consume, args=(k,)) for k in range(consumers)]
+        for t in threads: t.start()
+        start = time.perf_counter()
+        prods = [threading.Thread(target=produce) for _ in range(producers)]
+        for t in prods: t.start()
+        for t in prods: t.join()
+        put(q, [None] * consumers)
+        for t in threads: t.join()
+        assert sum(received) == per * producers
+        return per * producers / (time.perf_counter() - start)
+
+    def put_each(q, xs):
+        for x in xs: q.put(x)
+
+    cases = (
+        ("queue.Queue", Queue(capacity), put_each, lambda q: [q.get()]),
+        ("BlockingQueue put/get", BlockingQueue(capacity), put_each, lambda q: [q.get()]),
+        (f"BlockingQueue пачки по {batch}", BlockingQueue(capacity),
+         lambda q, xs: q.put_many(xs), lambda q: q.get_many(batch)),
+    )
+    for title, q, put, get_batch in cases:
+        print(f"   {title:26}: {run(q, put, get_batch):>10.0f} элем/сек")
+
+
+def fifo_benchmark(n=300000, window=1000):
+    """Скользящая нагрузка: держим window элементов, n раз enqueue + dequeue"""
+    print(f"\n=== FIFO без ограничения: {n} пар enqueue/dequeue, окно {window} ===")
+    for title, q in (("TwoStackQueue", TwoStackQueue()),
+                     ("GrowableCircularQueue", GrowableCircularQueue(8, shrink=True))):
+        start = time.perf_counter()
+        for i in range(window):
+            q.enqueue(i)
+        for i in range(n):
+            q.enqueue(i)
+            q.dequeue()
+        while not q.is_empty():
+            q.dequeue()
+        print(f"   {title:22}: {time.perf_counter() - start:.3f} сек")
+
+
+if __name__ == "__main__":
+    # Демонстрация
+    print("=== ОЧЕРЕДЬ НА ЦИКЛИЧЕСКОМ МАССИВЕ ===")
+    cq = CircularQueue(5)
+    print(f"Создана очередь емкостью 5")
+
+    for i in range(1, 6):
+        cq.enqueue(i * 10)
+        print(f"enqueue({i * 10}): {cq}")
+
+    print(f"\npeek: {cq.peek()}")
+    print(f"dequeue: {cq.dequeue()}, осталось: {cq}")
+    print(f"dequeue: {cq.dequeue()}, осталось: {cq}")
+
+    cq.enqueue(60)
+    print(f"enqueue(60): {cq}")
+    cq.enqueue(70)
+    print(f"enqueue(70): {cq}")
+    print(f"Размер: {len(cq)}, полная? {cq.is_full()}")
+
+    print("\n=== ОЧЕРЕДЬ НА ДВУХ СТЕКАХ ===")
+    tsq = TwoStackQueue()
+    print("Создана очередь на двух стеках")
+
+    for i in range(1, 6):
+        tsq.enqueue(i)
+        print(f"enqueue({i}): stack_in={tsq.stack_in}, stack_out={tsq.stack_out}")
+
+    print(f"\npeek: {tsq.peek()}")
+    print(f"dequeue: {tsq.dequeue()}")
+    print(f"Состояние: stack_in={tsq.stack_in}, stack_out={tsq.stack_out}")
+    print(f"dequeue: {tsq.dequeue()}")
+    print(f"Очередь: {tsq}")
+
+    tsq.enqueue(6)
+    tsq.enqueue(7)
+    print(f"\nenqueue(6), enqueue(7)")
+    print(f"Очередь: {tsq}")
+    print(f"Размер: {len(tsq)}")
+
+    # Сравнение сложности
+    print("\n=== СРАВНЕНИЕ СЛОЖНОСТИ ===")
+    print("Циклический массив:")
+    print("  enqueue: O(1)")
+    print("  dequeue: O(1)")
+    print("  peek: O(1)")
+    print("\nДва стека:")
+    print("  enqueue: O(1)")
+    print("  dequeue: O(n) худший, O(1) амортизированно")
+    print("  peek: O(n) худший, O(1) амортизированно")
+    print("\nПочему два стека работают?")
+    print("  В худшем случае при пустом stack_out")
+    print("  переливаем все элементы из stack_in: O(n)")
+    print("  Но это происходит редко, в среднем O(1)")
+
+    # Пример использования
+    print("\n=== ПРИМЕР ИСПОЛЬЗОВАНИЯ ===")
+    # Моделирование очереди задач
+    print("Очередь задач на печать:")
+    queue = TwoStackQueue()  # Или CircularQueue
+    runner = JobRunner(workers=2)
+
+    tasks = ["doc1.pdf", "doc2.pdf", "report.docx"]
+    for task in tasks:
+        runner.enqueue(queue, task)
+        print(f"Добавлена задача: {task}")
+
+    print("\nОбработка задач (2 принтера-потока):")
+    runner.drain(queue, print_job)
+    report = runner.shutdown()
+    for line in sorted(runner.results):
+        print(f"   {line}")
+    print_report("Итог", report)
+
+    print("\nПоток задач с обратным давлением:")
+    for title, processes, fn, arg, n in (("потоки, печать", False, print_job, "doc.pdf", 40),
+                                         ("процессы, CPU", True, cpu_job, 20000, 200)):
+        jobs = CircularQueue(n)
+        runner = JobRunner(workers=4, processes=processes, max_pending=8)
+        for _ in range(n):
+            runner.enqueue(jobs, arg)
+        runner.drain(jobs, fn)
+        print_report(title, runner.shutdown())
+
+    # Очередь между потоками
+    bq = BlockingQueue(3)
+    print(f"\nBlockingQueue(3): put_many(5 элементов, timeout=0.1) положил {bq.put_many(range(5), timeout=0.1)}")
+    print(f"get_many(10): {bq.get_many(10)}, get(timeout=0.1) на пустой:", end=" ")
+    try:
+        bq.get(timeout=0.1)
+    except Empty as e:
+        print(f"Empty('{e}')")
+
+    gq = GrowableCircularQueue(4, shrink=True)
+    for i in range(1, 4): gq.enqueue(i)
+    gq.dequeue(); gq.dequeue()
+    for i in range(4, 9): gq.enqueue(i)  # кольцо переходит через край, затем растет
+    print(f"\nGrowableCircularQueue: {gq}, емкость {gq.cap}")
+    while len(gq) > 1: gq.dequeue()
+    print(f"После dequeue до одного элемента: {gq}, емкость {gq.cap}")
+
+    async def async_demo():
+        aq = AsyncQueue(2)
+
+        async def producer():
+            for i in range(5):
+                await aq.put(i)  # при заполненной очереди ждет потребителя
+
+        task = asyncio.create_task(producer())
+        await asyncio.sleep(0)
+        print(f"\nAsyncQueue(2): после старта производителя в очереди {len(aq)}")
+        print(f"get_batch(3, timeout=0.1): {await aq.get_batch(3, timeout=0.1)}")
+        print(f"get(): {await aq.get()}, get(): {await aq.get()}, get(): {await aq.get()}")
+        await task
+        print(f"get_batch(3, timeout=0.05) на пустой: {await aq.get_batch(3, timeout=0.05)}")
+
+    asyncio.run(async_demo())
+
+    metrics = [5, 3, 8, 1, 4, 7, 2]
+    print(f"\nОкна по 3 из {metrics}:")
+    print(f"   min: {list(sliding_window(metrics, 3, min))}, max: {list(sliding_window(metrics, 3, max))}")
+    print(f"   сумма (AggQueue + operator.add): {list(sliding_window(metrics, 3, operator.add))}")
+
+    throughput_benchmark()
+    fifo_benchmark()
+    asyncio.run(async_benchmark())
+    ring_benchmark()
+    window_benchmark()
@@ -1,3 +1,10 @@
+import builtins
+import keyword
+import re
+import time
+from functools import lru_cache
+
+
 # Минимальный калькулятор
 class Stack:
     def __init__(self): self.data = []
@@ -115,15 +122,103 @@ def calculate(expr):
     return s[0]
 
 
-# Демо
-print("=== КАЛЬКУЛЯТОР ===")
-expr = "3+4*2"
-rpn = to_rpn(expr)
-result = calc_rpn(rpn)
-print(f"{expr} -> ОПН: {' '.join(rpn)} = {result}")
-print(f"calculate('{expr}') = {calculate(expr)}")
+# Компиляция формулы один раз: числа, имена переменных, + - * / ^ и скобки
+TOKEN = re.compile(r'\s*(?:(\d+\.\d*|\.\d+|\d+)|([A-Za-z_]\w*)|(\S))')
+PY_OPS = {'+': '+', '-': '-', '*': '*', '/': '/', '^': '**'}
+
+
+def tokenize(expr):
+    tokens = []
+    for num, name, op in TOKEN.findall(expr):
+        if name and keyword.iskeyword(name):
+            raise ValueError(f"Недопустимое имя переменной: {name}")
+        if op and op not in '+-*/^()':
+            raise ValueError(f"Неизвестный символ: {op}")
+        tokens.append(num or name or op)
+    return tokens
+
 
-# Еще примеры
-tests = ["3+4", "2*3+4", "2+3*4", "10-2*3"]
-for t in tests:
-    print(f"{t} = {calculate(t)}")
\ No newline at end of file
+def tokens_to_rpn(tokens):  # та же сортировочная станция, что в to_rpn
+    prec = {'+': 1, '-': 1, '*': 2, '/': 2, '^': 3}
+    out, s = [], Stack()
+    for t in tokens:
+        if t in prec:
+            while not s.empty() and s.peek() in prec and prec[s.peek()] >= prec[t]:
+                out.append(s.pop())
+            s.push(t)
+        elif t == '(':
+            s.push(t)
+        elif t == ')':
+            while not s.empty() and s.peek() != '(':
+                out.append(s.pop())
+            s.pop()  # удаляем '('
+        else:
+            out.append(t)
+    while not s.empty():
+        out.append(s.pop())
+    return out
+
+
+@lru_cache(maxsize=512)  # ключ - текст формулы; счетчики в compile.cache_info()
+def compile(expr):
+    """Формула -> функция с аргументами-переменными в порядке появления: f(x=1, y=2)"""
+    tokens = tokenize(expr)
+    depth = 0
+    for t in tokens:  # сортировочная станция молча теряет непарные скобки - проверяем заранее
+        depth += (t == '(') - (t == ')')
+        if depth < 0: raise ValueError(f"Некорректное выражение: {expr}")
+    if depth: raise ValueError(f"Некорректное выражение: {expr}")
+    names = list(dict.fromkeys(t for t in tokens if t[0].isalpha() or t[0] == '_'))
+    s = []
+    for t in tokens_to_rpn(tokens):
+        if t in PY_OPS:
+            if len(s) < 2: raise ValueError(f"Некорректное выражение: {expr}")
+            b, a = s.pop(), s.pop()
+            s.append(f"({a} {PY_OPS[t]} {b})")
+        elif t[0].isdigit() or t[0] == '.':  # "007" и ".5" - не литералы Python, пишем repr числа
+            s.append(repr(float(t)) if '.' in t else repr(int(t)))
+        elif t != '(':
+            s.append(t)
+    if len(s) != 1: raise ValueError(f"Некорректное выражение: {expr}")
+    # Один раз собираем код Python; дальше вызов - обычная функция без разбора
+    try:
+        code = builtins.compile(f"lambda {', '.join(names)}: {s[0]}", f"<formula {expr!r}>", "eval")
+    except SyntaxError:
+        raise ValueError(f"Некорректное выражение: {expr}") from None
+    func = eval(code, {"__builtins__": {}})
+    func.variables, func.expr = tuple(names), expr
+    return func
+
+
+if __name__ == "__main__":
+    # Демо
+    print("=== КАЛЬКУЛЯТОР ===")
+    expr = "3+4*2"
+    rpn = to_rpn(expr)
+    result = calc_rpn(rpn)
+    print(f"{expr} -> ОПН: {' '.join(rpn)} = {result}")
+    print(f"calculate('{expr}') = {calculate(expr)}")
+
+    # Еще примеры
+    tests = ["3+4", "2*3+4", "2+3*4", "10-2*3"]
+    for t in tests:
+        print(f"{t} = {calculate(t)}")
+
+    # Компиляция формул
+    print("\n=== КОМПИЛЯЦИЯ ФОРМУЛ ===")
+    price = compile("base * (1 + tax) - discount")
+    print(f"{price.expr}: переменные {price.variables}")
+    print(f"base=100, tax=0.2, discount=5 -> {price(base=100, tax=0.2, discount=5)}")
+    print(f"compile('3+4*2')() = {compile('3+4*2')()}, to_rpn/calc_rpn: {calc_rpn(to_rpn('3+4*2'))}")
+
+    n = 100000
+    start = time.perf_counter()
+    for _ in range(n):
+        calculate("2*3+4*5-6")
+    t_calc = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(n):
+        compile("2*3+4*5-6")()
+    t_comp = time.perf_counter() - start
+    print(f"{n} вычислений: calculate {t_calc:.3f} сек, compile(...)() {t_comp:.3f} сек")
+    print(f"Кэш формул: {compile.cache_info()}")